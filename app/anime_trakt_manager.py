@@ -10,18 +10,23 @@ import os
 import sys
 import time
 import re
-import yaml
+import copy
+import html
 import json
 import click
-import difflib
 import logging
-import requests
-from bs4 import BeautifulSoup
-from plexapi.server import PlexServer
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from rapidfuzz import fuzz, process, utils
 from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-from shared_utils import setup_rotating_logger
+from shared_utils import setup_rotating_logger, load_yaml_with_json_cache, dump_yaml_atomic, make_session
+
+# orjson is optional; it only speeds up serializing Trakt request bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import our Trakt authentication module
 import trakt_auth
@@ -31,9 +36,48 @@ console = Console()
 
 # Global variable for configuration
 CONFIG = {}
+# Parsed YAML files by path -> ((mtime_ns, size), data), reused while the file is
+# unchanged; least recently used entries are evicted past YAML_CACHE_SIZE
+_YAML_CACHE = OrderedDict()
+YAML_CACHE_SIZE = 100
 DATA_DIR = "data"
 CONFIG_FILE = "config/config.yaml"
 
+# Per-lookup progress messages go to the log file; set DAKOSYS_VERBOSE=1 to
+# also echo them to the console
+VERBOSE = os.environ.get('DAKOSYS_VERBOSE', '0') == '1'
+
+# Pooled HTTP session so Trakt/AnimeFillerList calls reuse keep-alive connections.
+# Idempotent requests are retried on rate limits and server errors; failed
+# responses are still returned so callers can report the status code.
+HTTP_TIMEOUT = 30
+# Episodes sent per POST to a Trakt list's /items endpoint
+TRAKT_BATCH_SIZE = 100
+# Trakt allows roughly one authenticated POST per second
+TRAKT_POST_INTERVAL = 1.0
+_SESSION = make_session(pool_size=10)
+
+# Per-process Trakt lookup caches. Seasons expire so long-running scheduler
+# processes still pick up newly aired episodes.
+_SHOW_ID_CACHE = {}
+# Shared read-only default for chained .get() lookups on API payloads
+_EMPTY = {}
+_SEASONS_CACHE = {}
+_TITLE_INDEX_CACHE = {}
+_ABS_INDEX_CACHE = {}
+# Plex library section key -> (updatedAt, {lowercased show title: tmdb id})
+_PLEX_INDEX_CACHE = {}
+SEASONS_CACHE_TTL = 3600
+# AnimeFillerList show slugs, kept in memory and in data/afl_shows.json so
+# back-to-back commands (each its own process) share one fetch
+_AFL_SHOWS_CACHE = {}
+AFL_SHOWS_CACHE_TTL = 3600
+# Trakt username -> (monotonic fetch time, list JSON) for /users/{username}/lists
+_TRAKT_LISTS_CACHE = {}
+TRAKT_LISTS_CACHE_TTL = 60
+# Show links on the /shows index, matched on the raw response bytes
+_AFL_HREF_RE = re.compile(rb"""href\s*=\s*["']/shows/([^"']+)["']""")
+
 # Setup logger with rotation
 if os.environ.get('RUNNING_IN_DOCKER') == 'true':
     data_dir = "/app/data"
@@ -50,6 +94,32 @@ except ImportError:
     NOTIFICATIONS_AVAILABLE = False
     logger.warning("Notifications module not available")
 
+def _dumps_json(payload):
+    """Serialize a request body to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+def _load_yaml_cached(path, force=False):
+    """Parse a YAML file, reusing the cached result while its mtime and size are unchanged.
+
+    A deep copy is returned so callers can mutate it without touching the cache.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(path)
+    if not force and cached is not None and cached[0] == signature:
+        _YAML_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    data = load_yaml_with_json_cache(path)
+
+    _YAML_CACHE[path] = (signature, data)
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
 def load_config():
     """Load configuration from YAML file."""
     global CONFIG
@@ -81,8 +151,7 @@ def load_config():
                 console.print(f"[yellow]Example: docker compose run --rm dakosys setup[/yellow]")
                 return False
 
-        with open(config_path, 'r') as file:
-            CONFIG = yaml.safe_load(file)
+        CONFIG = _load_yaml_cached(config_path)
 
         # Ensure data directory exists
         if not os.path.exists(data_dir):
@@ -106,18 +175,24 @@ def load_config():
             logger.warning(f"Could not load mappings from mappings.yaml: {str(e)}")
             # Continue with whatever was in CONFIG
 
+        # Cached Plex names depend on CONFIG['mappings']
+        _clear_mapping_caches()
+
         return True
     except Exception as e:
         console.print(f"[bold red]Error loading configuration: {str(e)}[/bold red]")
         return False
 
-def reload_config():
-    """Reload configuration from disk to get the latest mappings."""
+def reload_config(force=False):
+    """Reload configuration from disk to get the latest mappings.
+
+    Args:
+        force: Re-parse config.yaml even if it has not changed since the last load
+    """
     global CONFIG
     config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else CONFIG_FILE
     try:
-        with open(config_path, 'r') as file:
-            CONFIG = yaml.safe_load(file)
+        CONFIG = _load_yaml_cached(config_path, force=force)
             
         # Also load mappings from mappings file
         try:
@@ -136,6 +211,9 @@ def reload_config():
         except Exception as e:
             logger.warning(f"Could not load mappings from mappings.yaml: {str(e)}")
             # Continue with whatever was in CONFIG
+
+        # Cached Plex names depend on CONFIG['mappings']
+        _clear_mapping_caches()
             
         console.print("[green]Reloaded configuration with updated mappings.[/green]")
         return True
@@ -143,8 +221,40 @@ def reload_config():
         console.print(f"[yellow]Warning: Could not reload config: {str(e)}[/yellow]")
         return False
 
+# Merged in from mappings.yaml at load time and never written back to config.yaml
+_MAPPING_CONFIG_KEYS = ('mappings', 'trakt_mappings', 'title_mappings')
+
+def _save_config(config):
+    """Save config to config.yaml, leaving out the sections that belong to mappings.yaml."""
+    config_to_save = {key: value for key, value in config.items() if key not in _MAPPING_CONFIG_KEYS}
+    config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else CONFIG_FILE
+    dump_yaml_atomic(config_to_save, config_path)
+
+def _get_config():
+    """Get the active configuration, falling back when CONFIG isn't loaded.
+
+    Functions imported by other modules (e.g. auto_update) run without cli()
+    having populated CONFIG, so try trakt_auth's loader and then the config
+    file directly. Not memoized, since CONFIG is rebound on every (re)load.
+    """
+    if CONFIG and CONFIG.get('trakt'):
+        return CONFIG
+
+    config_data = trakt_auth.load_config()
+    if config_data and config_data.get('trakt'):
+        return config_data
+
+    config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else CONFIG_FILE
+    if os.path.exists(config_path):
+        logger.info(f"Loaded configuration directly from {config_path}")
+        return _load_yaml_cached(config_path)
+
+    return config_data or CONFIG
+
 def connect_to_plex():
     """Connect to Plex server."""
+    from plexapi.server import PlexServer
+
     try:
         console.print("[bold blue]Connecting to Plex server...[/bold blue]")
         plex = PlexServer(CONFIG['plex']['url'], CONFIG['plex']['token'])
@@ -175,25 +285,51 @@ def get_anime_libraries(plex):
 
     return libraries
 
+def _tmdb_id_from_guids(show):
+    """Return the TMDB ID from a Plex show's guids, or None."""
+    return next((guid.id.split('//', 1)[1] for guid in show.guids if guid.id.startswith('tmdb://')), None)
+
+def _get_plex_title_index(anime_library):
+    """Get a {lowercased title: tmdb id} index for a Plex library.
+
+    The index is rebuilt only when the library's updatedAt changes, so repeated
+    lookups don't re-fetch and re-scan every show in the section.
+    """
+    cached = _PLEX_INDEX_CACHE.get(anime_library.key)
+    if cached and cached[0] == anime_library.updatedAt:
+        return cached[1]
+
+    title_index = {}
+    for show in anime_library.all():
+        title = show.title.lower()
+        if title in title_index:
+            continue
+        tmdb_id = _tmdb_id_from_guids(show)
+        if tmdb_id:
+            title_index[title] = tmdb_id
+
+    _PLEX_INDEX_CACHE[anime_library.key] = (anime_library.updatedAt, title_index)
+    return title_index
+
 def get_tmdb_id_from_plex(plex, anime_name):
     """Get TMDB ID for a show from Plex."""
     try:
         # Get the mapped Plex show name
         mapped_anime_name = CONFIG.get('mappings', {}).get(anime_name.lower(), anime_name)
 
-        console.print(f"[blue]Looking for '{mapped_anime_name}' in Plex libraries...[/blue]")
+        logger.info(f"Looking for '{mapped_anime_name}' in Plex libraries")
+        if VERBOSE:
+            console.print(f"[blue]Looking for '{mapped_anime_name}' in Plex libraries...[/blue]")
 
         # Search across all anime libraries
         libraries = get_anime_libraries(plex)
         for anime_library in libraries:
-            # Search for the show in this library
-            for show in anime_library.all():
-                if show.title.lower() == mapped_anime_name.lower():
-                    for guid in show.guids:
-                        if 'tmdb://' in guid.id:
-                            tmdb_id = guid.id.split('//')[1]
-                            console.print(f"[green]Found TMDB ID: {tmdb_id}[/green]")
-                            return tmdb_id
+            tmdb_id = _get_plex_title_index(anime_library).get(mapped_anime_name.lower())
+            if tmdb_id:
+                logger.info(f"Found TMDB ID: {tmdb_id}")
+                if VERBOSE:
+                    console.print(f"[green]Found TMDB ID: {tmdb_id}[/green]")
+                return tmdb_id
 
         console.print(f"[yellow]Could not find TMDB ID for '{mapped_anime_name}' in any Plex library.[/yellow]")
         return None
@@ -201,8 +337,60 @@ def get_tmdb_id_from_plex(plex, anime_name):
         console.print(f"[bold red]Error getting TMDB ID: {str(e)}[/bold red]")
         return None
 
-def get_anime_episodes(anime_name, episode_type_filter=None, silent=False):
-    """Get episodes from AnimeFillerList website."""
+def _fetch_afl_shows():
+    """Get the show slugs linked from the AnimeFillerList /shows index page.
+
+    The list is cached in memory and on disk for AFL_SHOWS_CACHE_TTL seconds.
+    Returns None if the page could not be fetched.
+    """
+    cached = _AFL_SHOWS_CACHE.get('shows')
+    if cached and time.monotonic() - cached[0] < AFL_SHOWS_CACHE_TTL:
+        return cached[1]
+
+    data_dir = DATA_DIR
+    if os.environ.get('RUNNING_IN_DOCKER') == 'true':
+        data_dir = "/app/data"
+    cache_file = os.path.join(data_dir, "afl_shows.json")
+
+    try:
+        if time.time() - os.path.getmtime(cache_file) < AFL_SHOWS_CACHE_TTL:
+            with open(cache_file, 'r') as f:
+                all_afl_shows = json.load(f)
+            _AFL_SHOWS_CACHE['shows'] = (time.monotonic(), all_afl_shows)
+            return all_afl_shows
+    except (OSError, ValueError):
+        pass
+
+    response = _SESSION.get('https://www.animefillerlist.com/shows', timeout=HTTP_TIMEOUT)
+    if response.status_code != 200:
+        logger.error(f"Failed to fetch data from AnimeFillerList. Status Code: {response.status_code}")
+        return None
+
+    # Only the slugs are needed, so skip decoding and parsing the whole page
+    all_afl_shows = [
+        html.unescape(slug.decode('utf-8', 'replace'))
+        for slug in _AFL_HREF_RE.findall(response.content)
+    ]
+    _AFL_SHOWS_CACHE['shows'] = (time.monotonic(), all_afl_shows)
+
+    try:
+        os.makedirs(data_dir, exist_ok=True)
+        tmp_file = cache_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(all_afl_shows, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write AnimeFillerList show cache: {str(e)}")
+
+    return all_afl_shows
+
+def _fetch_anime_episodes(anime_name, silent=False):
+    """Fetch and parse every episode row of an AnimeFillerList show page.
+
+    Returns the episodes in page order, or None if the page could not be fetched.
+    """
+    import lxml.html
+
     global CONFIG
     try:
         base_url = 'https://www.animefillerlist.com/shows/'
@@ -211,14 +399,13 @@ def get_anime_episodes(anime_name, episode_type_filter=None, silent=False):
         if not silent:
             logger.info(f"Fetching episode data from {anime_url}")
 
-        response = requests.get(anime_url)
+        response = _SESSION.get(anime_url, timeout=HTTP_TIMEOUT)
         if response.status_code != 200:
             logger.error(f"Failed to fetch data from AnimeFillerList. Status Code: {response.status_code}")
-            return []
+            return None
 
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
-        filtered_episodes = []
+        tree = lxml.html.fromstring(response.content)
+        episodes = []
 
         # Ensure CONFIG is loaded or get a separate config instance
         # This handles both module-level initialization and direct function calls
@@ -234,55 +421,84 @@ def get_anime_episodes(anime_name, episode_type_filter=None, silent=False):
         title_mappings = config_data.get('title_mappings', {}) or {}
         anime_mapping = title_mappings.get(anime_name, {}) or {}
 
-        for row in soup.find_all('tr'):
-            columns = row.find_all('td')
+        # Resolve the per-anime mapping options once rather than per row
+        remove_dashes = bool(anime_mapping.get('remove_dashes', False)) if anime_mapping else False
+        special_matches = (anime_mapping.get('special_matches', {}) or {}) if anime_mapping else {}
+
+        # Remove patterns followed by zero-padded numbers, applied in order
+        remove_parts = []
+        if anime_mapping:
+            remove_parts = [pattern for pattern in anime_mapping.get('remove_patterns', []) or [] if pattern]
+            remove_parts += [f'{number:02d}' for number in anime_mapping.get('remove_numbers', []) or []
+                             if isinstance(number, int)]
+
+        # Only the first three cells of each episode row are needed; pulling them
+        # straight from the lxml tree avoids building a full soup of Tag objects
+        for row in tree.xpath('//table//tr[td]'):
+            # text_content() is used because titles are wrapped in links
+            columns = row.xpath('./td')
             if len(columns) >= 3:
-                episode_number = columns[0].text.strip()
-                episode_name = columns[1].text.strip()
-                episode_type = columns[2].text.strip()
+                episode_number = columns[0].text_content().strip()
+                episode_name = columns[1].text_content().strip()
+                episode_type = columns[2].text_content().strip()
 
                 # Apply title mappings if configured
                 if anime_mapping:
-                    # Apply remove patterns
-                    remove_patterns = anime_mapping.get('remove_patterns', []) or []
-                    for pattern in remove_patterns:
-                        episode_name = episode_name.replace(pattern, '').strip()
-
-                    # Remove specific numbers
-                    remove_numbers = anime_mapping.get('remove_numbers', []) or []
-                    for number in remove_numbers:
-                        try:
-                            episode_name = episode_name.replace(f'{number:02d}', '').strip()
-                        except:
-                            pass
+                    # Apply remove patterns and remove specific numbers
+                    for part in remove_parts:
+                        episode_name = episode_name.replace(part, '').strip()
 
                     # Remove dashes if configured
-                    if anime_mapping.get('remove_dashes', False):
+                    if remove_dashes:
                         episode_name = episode_name.replace('-', '').strip()
 
                     # Apply special matches
-                    special_matches = anime_mapping.get('special_matches', {}) or {}
                     special_match = special_matches.get(episode_name)
                     if special_match:
                         episode_name = special_match
 
-                # Filter by episode type if specified
-                if not episode_type_filter or episode_type.lower() == episode_type_filter.lower():
-                    filtered_episodes.append({
-                        'number': episode_number,
-                        'name': episode_name,
-                        'type': episode_type
-                    })
+                episodes.append({
+                    'number': episode_number,
+                    'name': episode_name,
+                    'type': episode_type
+                })
 
-        if not silent:
-            logger.info(f"Found {len(filtered_episodes)} episodes matching filter: {episode_type_filter}")
-        return filtered_episodes
+        return episodes
     except Exception as e:
         logger.error(f"Error fetching episodes: {str(e)}")
+        return None
+
+def get_all_anime_episodes(anime_name, silent=False):
+    """Get episodes from AnimeFillerList grouped by episode type.
+
+    The show page is fetched and parsed once; keys are the lower-cased
+    AnimeFillerList type names (e.g. 'manga canon').
+    """
+    episodes_by_type = {}
+    for episode in _fetch_anime_episodes(anime_name, silent) or []:
+        episodes_by_type.setdefault(episode['type'].lower(), []).append(episode)
+    return episodes_by_type
+
+def get_anime_episodes(anime_name, episode_type_filter=None, silent=False):
+    """Get episodes from AnimeFillerList website."""
+    episodes = _fetch_anime_episodes(anime_name, silent)
+    if episodes is None:
         return []
 
+    # Filter by episode type if specified
+    if episode_type_filter:
+        type_filter = episode_type_filter.lower()
+        episodes = [episode for episode in episodes if episode['type'].lower() == type_filter]
+
+    if not silent:
+        logger.info(f"Found {len(episodes)} episodes matching filter: {episode_type_filter}")
+    return episodes
+
 def get_trakt_show_id(access_token, tmdb_id):
     """Get Trakt show ID using TMDB ID."""
+    if tmdb_id in _SHOW_ID_CACHE:
+        return _SHOW_ID_CACHE[tmdb_id]
+
     try:
         # Get headers from the trakt_auth module
         headers = trakt_auth.get_trakt_headers(access_token)
@@ -292,13 +508,16 @@ def get_trakt_show_id(access_token, tmdb_id):
 
         trakt_api_url = 'https://api.trakt.tv'
         search_api_url = f'{trakt_api_url}/search/tmdb/{tmdb_id}?type=show'
-        response = requests.get(search_api_url, headers=headers)
+        response = _SESSION.get(search_api_url, headers=headers, timeout=HTTP_TIMEOUT)
 
         if response.status_code == 200:
             show_results = response.json()
             if show_results:
                 trakt_show_id = show_results[0]['show']['ids']['trakt']
-                console.print(f"[green]Found Trakt show ID: {trakt_show_id}[/green]")
+                logger.info(f"Found Trakt show ID: {trakt_show_id}")
+                if VERBOSE:
+                    console.print(f"[green]Found Trakt show ID: {trakt_show_id}[/green]")
+                _SHOW_ID_CACHE[tmdb_id] = trakt_show_id
                 return trakt_show_id
         else:
             console.print(f"[bold red]Failed to search on Trakt using TMDB ID. Status Code: {response.status_code}[/bold red]")
@@ -309,6 +528,7 @@ def get_trakt_show_id(access_token, tmdb_id):
         console.print(f"[bold red]Error getting Trakt show ID: {str(e)}[/bold red]")
         return None
 
+@functools.lru_cache(maxsize=512)
 def get_plex_name(afl_name):
     """Convert AnimeFillerList name to user-friendly Plex name.
 
@@ -330,32 +550,58 @@ def get_plex_name(afl_name):
 
     return plex_name
 
+@functools.lru_cache(maxsize=1)
+def _plex_to_afl_mappings():
+    """Reverse of CONFIG['mappings'] keyed by lowercased Plex title.
+
+    The first AFL name (in mapping order) wins for a given Plex title. Cleared
+    by _clear_mapping_caches whenever the mappings change.
+    """
+    reverse = {}
+    for afl_name, plex_name in CONFIG.get('mappings', {}).items():
+        reverse.setdefault(plex_name.lower(), afl_name)
+    return reverse
+
+def _clear_mapping_caches():
+    """Drop lookups derived from CONFIG['mappings'] after it is reloaded or changed."""
+    get_plex_name.cache_clear()
+    _plex_to_afl_mappings.cache_clear()
+
+# Patterns used by normalize_episode_title, compiled once at import
+_RE_PUNCT = re.compile(r'[^\w\s]')
+_RE_PART = re.compile(r'part\s+(\d+)')
+_RE_PAREN_NUM = re.compile(r'\((\d+)\)')
+_RE_EPNUM = re.compile(r'\d+x\d+\s*')
+_RE_PAREN = re.compile(r'\(\d+\)\s*')
+_RE_WORDS = re.compile(r'\b(?:episode|ep|the|and)\b')
+_RE_WS = re.compile(r'\s+')
+
+# Patterns used while matching and formatting names
+_RE_DIGITS = re.compile(r'\D')
+# Code Geass titles: "Stage N - title" (S1), "Turn N - title" (S2), "Final Turn - title"
+_RE_CG = re.compile(r'(?:(Stage|Turn) (\d+)|Final Turn)(?:\s*-\s*)?(.+)?')
+_RE_URL_UNSAFE = re.compile(r'[^\w\-]')
+_RE_ARTICLES = re.compile(r'\b(?:the|a|an|of|and)\b')
+
+@functools.lru_cache(maxsize=4096)
 def normalize_episode_title(title):
     """Normalize episode title for better matching."""
     # Remove punctuation and convert to lowercase
-    title = re.sub(r'[^\w\s]', ' ', title).lower()
+    title = _RE_PUNCT.sub(' ', title).lower()
 
     # Replace "part X" with "(X)" and vice versa
-    title = re.sub(r'part\s+(\d+)', r'\1', title)
-    title = re.sub(r'\((\d+)\)', r'\1', title)
+    title = _RE_PART.sub(r'\1', title)
+    title = _RE_PAREN_NUM.sub(r'\1', title)
 
     # Remove episode numbers like "1x22" or "(22)"
-    title = re.sub(r'\d+x\d+\s*', '', title)
-    title = re.sub(r'\(\d+\)\s*', '', title)
-
-    # Handle other common replacements
-    replacements = {
-        'episode': '',
-        'ep': '',
-        'the': '',
-        'and': '',
-    }
+    title = _RE_EPNUM.sub('', title)
+    title = _RE_PAREN.sub('', title)
 
-    for orig, repl in replacements.items():
-        title = re.sub(r'\b' + orig + r'\b', repl, title)
+    # Drop common filler words
+    title = _RE_WORDS.sub('', title)
 
     # Remove extra spaces
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = _RE_WS.sub(' ', title).strip()
 
     return title
 
@@ -381,32 +627,99 @@ def handle_special_anime_titles(anime_name, episode):
 
     return modified_episode
 
+def _get_all_seasons(trakt_show_id, access_token):
+    """Get all seasons (with full episode data) for a Trakt show.
+
+    The response is cached per show for SEASONS_CACHE_TTL seconds so repeated
+    lookups for the same show cost one API call. Returns None on failure.
+    """
+    cached = _SEASONS_CACHE.get(trakt_show_id)
+    if cached and time.monotonic() - cached[0] < SEASONS_CACHE_TTL:
+        return cached[1]
+
+    headers = trakt_auth.get_trakt_headers(access_token)
+    if not headers:
+        return None
+
+    trakt_api_url = 'https://api.trakt.tv'
+    trakt_seasons_url = f'{trakt_api_url}/shows/{trakt_show_id}/seasons?extended=episodes,full'
+    response = _SESSION.get(trakt_seasons_url, headers=headers, timeout=HTTP_TIMEOUT)
+
+    if response.status_code != 200:
+        console.print(f"[bold red]Failed to get Trakt seasons information. Status Code: {response.status_code}[/bold red]")
+        return None
+
+    seasons_info = response.json()
+    _SEASONS_CACHE[trakt_show_id] = (time.monotonic(), seasons_info)
+    return seasons_info
+
+def _get_title_index(trakt_show_id, access_token):
+    """Map normalized episode titles to (season, episode, trakt_id) for a show.
+
+    Built once per seasons payload; the first episode with a given normalized
+    title wins. Returns None if the seasons could not be fetched.
+    """
+    seasons_info = _get_all_seasons(trakt_show_id, access_token)
+    if seasons_info is None:
+        return None
+
+    cached = _TITLE_INDEX_CACHE.get(trakt_show_id)
+    if cached and cached[0] is seasons_info:
+        return cached[1]
+
+    title_index = {}
+    for season_info in seasons_info:
+        for episode_info in season_info.get('episodes', []):
+            normalized = normalize_episode_title(episode_info.get('title') or '')
+            if normalized not in title_index:
+                title_index[normalized] = (
+                    season_info.get('number'),
+                    episode_info.get('number'),
+                    episode_info.get('ids', {}).get('trakt')
+                )
+
+    _TITLE_INDEX_CACHE[trakt_show_id] = (seasons_info, title_index)
+    return title_index
+
+def _get_abs_number_index(trakt_show_id, access_token):
+    """Map absolute episode numbers to (season, episode) for a show.
+
+    Built once per seasons payload. Returns None if the seasons could not be
+    fetched.
+    """
+    seasons_info = _get_all_seasons(trakt_show_id, access_token)
+    if seasons_info is None:
+        return None
+
+    cached = _ABS_INDEX_CACHE.get(trakt_show_id)
+    if cached and cached[0] is seasons_info:
+        return cached[1]
+
+    abs_index = {}
+    for season_info in seasons_info:
+        for episode_info in season_info.get('episodes', []):
+            number_abs = episode_info.get('number_abs')
+            if number_abs is not None and number_abs not in abs_index:
+                abs_index[number_abs] = (season_info.get('number'), episode_info.get('number'))
+
+    _ABS_INDEX_CACHE[trakt_show_id] = (seasons_info, abs_index)
+    return abs_index
+
 def get_trakt_season_and_episode_by_number(trakt_show_id, episode_number_abs, access_token):
     """Get Trakt season and episode numbers using absolute episode number."""
     try:
-        headers = trakt_auth.get_trakt_headers(access_token)
-        if not headers:
+        abs_index = _get_abs_number_index(trakt_show_id, access_token)
+        if abs_index is None:
             return None, None
 
-        trakt_api_url = 'https://api.trakt.tv'
-        trakt_seasons_url = f'{trakt_api_url}/shows/{trakt_show_id}/seasons?extended=episodes,full'
-        response = requests.get(trakt_seasons_url, headers=headers)
-
-        if response.status_code == 200:
-            seasons_info = response.json()
-
-            for season_info in seasons_info:
-                for episode_info in season_info.get('episodes', []):
-                    if episode_info.get('number_abs') == int(episode_number_abs):
-                        trakt_season = season_info.get('number')
-                        trakt_episode = episode_info.get('number')
-                        return trakt_season, trakt_episode
+        match = abs_index.get(int(episode_number_abs))
+        if match:
+            return match
 
+        logger.warning(f"Episode number_abs '{episode_number_abs}' not found in any season.")
+        if VERBOSE:
             console.print(f"[yellow]Episode number_abs '{episode_number_abs}' not found in any season.[/yellow]")
-            return None, None
-        else:
-            console.print(f"[bold red]Failed to get Trakt seasons information. Status Code: {response.status_code}[/bold red]")
-            return None, None
+        return None, None
     except Exception as e:
         console.print(f"[bold red]Error getting season info: {str(e)}[/bold red]")
         return None, None
@@ -414,58 +727,40 @@ def get_trakt_season_and_episode_by_number(trakt_show_id, episode_number_abs, ac
 def get_trakt_season_and_episode_by_title(trakt_show_id, episode_title, access_token):
     """Get Trakt season and episode numbers using episode title."""
     try:
-        headers = trakt_auth.get_trakt_headers(access_token)
-        if not headers:
-            return None, None
-
-        trakt_api_url = 'https://api.trakt.tv'
         normalized_title = normalize_episode_title(episode_title)
 
         # Log the normalized title for debugging
         logger.info(f"Looking for episode: '{episode_title}' (normalized: '{normalized_title}')")
 
-        trakt_seasons_url = f'{trakt_api_url}/shows/{trakt_show_id}/seasons?extended=episodes'
-        response = requests.get(trakt_seasons_url, headers=headers)
+        title_index = _get_title_index(trakt_show_id, access_token)
+        if title_index is None:
+            return None, None
 
-        if response.status_code == 200:
-            seasons_info = response.json()
-
-            # Closest match tracking
-            best_match = None
-            best_score = 0
-            best_season = None
-            best_episode = None
-
-            for season_info in seasons_info:
-                for episode_info in season_info.get('episodes', []):
-                    trakt_title = episode_info.get('title', '')
-                    normalized_trakt_title = normalize_episode_title(trakt_title)
-
-                    # Try exact match after normalization
-                    if normalized_trakt_title == normalized_title:
-                        return season_info.get('number'), episode_info.get('number')
-
-                    # Calculate similarity for fuzzy matching
-                    similarity = difflib.SequenceMatcher(None, normalized_title, normalized_trakt_title).ratio()
-                    if similarity > 0.7 and similarity > best_score:  # Threshold for matches
-                        best_score = similarity
-                        best_match = trakt_title
-                        best_season = season_info.get('number')
-                        best_episode = episode_info.get('number')
-
-            # If we found a good fuzzy match
-            if best_match and best_score > 0.7:
-                logger.info(f"Fuzzy matched '{episode_title}' to '{best_match}' (score: {best_score:.2f})")
-                return best_season, best_episode
-
-            # If nothing was found, log useful information
-            logger.warning(f"Episode title '{episode_title}' not found in any season. Closest match: '{best_match}' (score: {best_score:.2f})")
+        # Try exact match after normalization
+        exact = title_index.get(normalized_title)
+        if exact:
+            return exact[0], exact[1]
+
+        # Fuzzy match against every indexed title in one call
+        best_match = None
+        best_score = 0
+        result = process.extractOne(normalized_title, list(title_index), scorer=fuzz.ratio, score_cutoff=70)
+        if result:
+            best_match = result[0]
+            best_score = result[1] / 100
+
+        # If we found a good fuzzy match
+        if best_match:
+            best_season, best_episode, _ = title_index[best_match]
+            logger.info(f"Fuzzy matched '{episode_title}' to '{best_match}' (score: {best_score:.2f})")
+            return best_season, best_episode
+
+        # If nothing was found, log useful information
+        logger.warning(f"Episode title '{episode_title}' not found in any season. Closest match: '{best_match}' (score: {best_score:.2f})")
+        if VERBOSE:
             console.print(f"[yellow]Episode title '{episode_title}' not found. Closest match: '{best_match}' (similarity: {best_score*100:.0f}%)[/yellow]")
 
-            return None, None
-        else:
-            console.print(f"[bold red]Failed to get Trakt seasons information. Status Code: {response.status_code}[/bold red]")
-            return None, None
+        return None, None
     except Exception as e:
         console.print(f"[bold red]Error getting season info by title: {str(e)}[/bold red]")
         return None, None
@@ -479,7 +774,7 @@ def get_trakt_episode_id(trakt_show_id, trakt_season, trakt_episode, access_toke
 
         trakt_api_url = 'https://api.trakt.tv'
         trakt_season_url = f'{trakt_api_url}/shows/{trakt_show_id}/seasons/{trakt_season}?extended=episodes'
-        response = requests.get(trakt_season_url, headers=headers)
+        response = _SESSION.get(trakt_season_url, headers=headers, timeout=HTTP_TIMEOUT)
 
         if response.status_code == 200:
             season_info = response.json()
@@ -495,7 +790,9 @@ def get_trakt_episode_id(trakt_show_id, trakt_season, trakt_episode, access_toke
                 trakt_episode_id = episode_info.get('ids', {}).get('trakt')
                 return trakt_episode_id
             else:
-                console.print(f"[yellow]Episode {trakt_episode} not found in season {trakt_season}.[/yellow]")
+                logger.warning(f"Episode {trakt_episode} not found in season {trakt_season}.")
+                if VERBOSE:
+                    console.print(f"[yellow]Episode {trakt_episode} not found in season {trakt_season}.[/yellow]")
                 return None
         else:
             console.print(f"[bold red]Failed to get Trakt season information. Status Code: {response.status_code}[/bold red]")
@@ -504,6 +801,25 @@ def get_trakt_episode_id(trakt_show_id, trakt_season, trakt_episode, access_toke
         console.print(f"[bold red]Error getting episode ID: {str(e)}[/bold red]")
         return None
 
+def get_trakt_user_lists(headers):
+    """Get the configured user's Trakt lists, reusing a recent fetch.
+
+    Returns (lists, status_code); lists is None if the request failed.
+    """
+    username = CONFIG['trakt']['username']
+    cached = _TRAKT_LISTS_CACHE.get(username)
+    if cached and time.monotonic() - cached[0] < TRAKT_LISTS_CACHE_TTL:
+        return cached[1], 200
+
+    lists_url = f"https://api.trakt.tv/users/{username}/lists"
+    response = _SESSION.get(lists_url, headers=headers, timeout=HTTP_TIMEOUT)
+    if response.status_code != 200:
+        return None, response.status_code
+
+    trakt_lists = response.json()
+    _TRAKT_LISTS_CACHE[username] = (time.monotonic(), trakt_lists)
+    return trakt_lists, response.status_code
+
 def create_or_get_trakt_list(list_name, access_token):
     """Create a new Trakt list or get existing one."""
     try:
@@ -513,7 +829,7 @@ def create_or_get_trakt_list(list_name, access_token):
 
         trakt_api_url = 'https://api.trakt.tv'
         list_search_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists"
-        response = requests.get(list_search_url, headers=headers)
+        response = _SESSION.get(list_search_url, headers=headers, timeout=HTTP_TIMEOUT)
 
         if response.status_code == 200:
             existing_lists = response.json()
@@ -531,9 +847,10 @@ def create_or_get_trakt_list(list_name, access_token):
                 }
 
                 create_list_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists"
-                response = requests.post(create_list_url, headers=headers, json=create_list_payload)
+                response = _SESSION.post(create_list_url, headers=headers, json=create_list_payload, timeout=HTTP_TIMEOUT)
 
                 if response.status_code == 201:
+                    _TRAKT_LISTS_CACHE.pop(CONFIG['trakt']['username'], None)
                     list_id = response.json().get('ids', {}).get('trakt')
                     console.print(f"[green]Trakt list '{list_name}' created successfully with ID {list_id}.[/green]")
                     return list_id, False
@@ -570,7 +887,7 @@ def get_existing_episodes_in_trakt_list(list_id, access_token):
 
         trakt_api_url = 'https://api.trakt.tv'
         list_items_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists/{list_id}/items"
-        response = requests.get(list_items_url, headers=headers)
+        response = _SESSION.get(list_items_url, headers=headers, timeout=HTTP_TIMEOUT)
 
         if response.status_code == 200:
             return response.json()
@@ -590,8 +907,7 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
     3. Adding episodes in batches
     4. Handling rate limits with proper retries
     """
-    # Import os at the function level so it's available throughout the function
-    import os
+    from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
 
     try:
         # Robust config loading with multiple fallbacks
@@ -601,24 +917,7 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
         notifications_enabled = False
 
         try:
-            # Try multiple methods to get config, in order of preference
-
-            # 1. Try global CONFIG if available
-            if 'CONFIG' in globals() and globals()['CONFIG'] is not None:
-                config_data = globals()['CONFIG']
-
-            # 2. Try trakt_auth module
-            if (not config_data or not config_data.get('trakt')) and 'trakt_auth' in globals() and hasattr(trakt_auth, 'load_config'):
-                config_data = trakt_auth.load_config()
-
-            # 3. If all else fails, load directly from file
-            if not config_data or not config_data.get('trakt'):
-                import yaml
-                config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else "config/config.yaml"
-                if os.path.exists(config_path):
-                    with open(config_path, 'r') as file:
-                        config_data = yaml.safe_load(file)
-                        logger.info(f"Loaded configuration directly from {config_path}")
+            config_data = _get_config()
 
             # Extract username with proper error handling
             if config_data and isinstance(config_data, dict):
@@ -652,59 +951,68 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
 
         trakt_api_url = 'https://api.trakt.tv'
 
-        # Step 1: Get all existing episodes in the list (one API call) if not provided
-        if existing_trakt_ids is None:
-            logger.info(f"Getting existing episodes in list {list_id}")
-            list_items_url = f"{trakt_api_url}/users/{trakt_username}/lists/{list_id}/items"
-            response = requests.get(list_items_url, headers=headers)
-
-            if response.status_code != 200:
-                console.print(f"[bold red]Failed to get list items. Status: {response.status_code}[/bold red]")
-                return False, False, None
-
-            existing_episodes = response.json()
-
-            # Extract Trakt IDs of existing episodes for O(1) lookups
-            existing_trakt_ids = set()
-            for item in existing_episodes:
-                if item.get('type') == 'episode' and 'episode' in item:
-                    trakt_id = item['episode'].get('ids', {}).get('trakt')
-                    if trakt_id:
-                        existing_trakt_ids.add(trakt_id)
+        # Steps 1 and 2 are independent API calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Step 2: Get all seasons data for this show (one API call)
+            logger.info(f"Getting all seasons data for show {trakt_show_id}")
+            seasons_future = executor.submit(_get_all_seasons, trakt_show_id, access_token)
+
+            # Step 1: Get all existing episodes in the list (one API call) if not provided
+            if existing_trakt_ids is None:
+                logger.info(f"Getting existing episodes in list {list_id}")
+                list_items_url = f"{trakt_api_url}/users/{trakt_username}/lists/{list_id}/items"
+                response = executor.submit(_SESSION.get, list_items_url, headers=headers, timeout=HTTP_TIMEOUT).result()
+
+                if response.status_code != 200:
+                    console.print(f"[bold red]Failed to get list items. Status: {response.status_code}[/bold red]")
+                    return False, False, None
+
+                existing_episodes = response.json()
+
+                # Extract Trakt IDs of existing episodes for O(1) lookups
+                existing_trakt_ids = {
+                    trakt_id
+                    for item in existing_episodes
+                    if item.get('type') == 'episode' and 'episode' in item
+                    for trakt_id in (item['episode'].get('ids', {}).get('trakt'),)
+                    if trakt_id
+                }
 
-            logger.info(f"Found {len(existing_trakt_ids)} existing episodes in list")
+                logger.info(f"Found {len(existing_trakt_ids)} existing episodes in list")
 
-        # Step 2: Get all seasons data for this show (one API call)
-        logger.info(f"Getting all seasons data for show {trakt_show_id}")
-        trakt_seasons_url = f'{trakt_api_url}/shows/{trakt_show_id}/seasons?extended=episodes,full'
-        response = requests.get(trakt_seasons_url, headers=headers)
+            all_seasons = seasons_future.result()
 
-        if response.status_code != 200:
-            console.print(f"[bold red]Failed to get seasons data. Status: {response.status_code}[/bold red]")
+        if all_seasons is None:
             return False, False, None
 
-        all_seasons = response.json()
-
         # Step 3: Create lookup dictionaries for episodes
         # Apply special handling for known problematic anime
         special_anime = False
         if anime_name and anime_name.lower() in ['code-geass', 'code-geass-lelouch-of-the-rebellion']:
             special_anime = True
             logger.info(f"Detected {anime_name} - applying special title handling")
+
+        # (season, episode) -> Trakt episode, for direct season/number matches
+        season_ep_index = {}
+        if special_anime:
+            for season in all_seasons:
+                for ep_data in season.get('episodes', []):
+                    season_ep_index.setdefault((season.get('number'), ep_data.get('number')), ep_data)
         # Title-based lookup
         episode_by_title = {}
-        # Number-based lookup
+        # Number-based lookup, keyed by int absolute episode number
         episode_by_number = {}
 
         for season in all_seasons:
             season_num = season.get('number')
             if 'episodes' in season:
                 for episode in season.get('episodes', []):
+                    episode_num = episode.get('number')
+                    trakt_id = (episode.get('ids') or _EMPTY).get('trakt')
+
                     # Store by title for title-based matching
                     title = episode.get('title', '').lower()
                     if title:
-                        trakt_id = episode.get('ids', {}).get('trakt')
-                        episode_num = episode.get('number')
                         if trakt_id:
                             # Store original title
                             episode_by_title[title] = {
@@ -725,20 +1033,42 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
                     # Store by absolute number for number-based matching
                     abs_num = episode.get('number_abs')
                     if abs_num:
-                        trakt_id = episode.get('ids', {}).get('trakt')
                         if trakt_id:
-                            episode_by_number[str(abs_num)] = {
+                            episode_by_number[int(abs_num)] = {
                                 'season': season_num,
                                 'episode': episode_num,
                                 'trakt_id': trakt_id
                             }
 
+        # Candidate titles for fuzzy matching, built once for all episodes
+        title_keys = list(episode_by_title)
+
+        # Title mappings don't vary per episode, so resolve them up front
+        title_mappings = config_data.get('title_mappings') or {}
+        anime_mapping = title_mappings.get(anime_name) or {}
+        special_matches = anime_mapping.get('special_matches') or {}
+
         # Initialize result tracking variables
+        # Matched episodes are kept as payload items plus a parallel list of names
         episodes_to_add = []
+        episodes_to_add_names = []
+        # Names of episodes that could not be matched or added
         failed_episodes = []
         skipped_episodes = []
         failure_details = []
 
+        # Callers may pass any iterable of IDs; membership is checked per match
+        existing_trakt_ids = frozenset(existing_trakt_ids)
+
+        def record_match(trakt_id, name, skip_key):
+            """Queue a matched episode for adding, or skip it if already in the list."""
+            if trakt_id in existing_trakt_ids:
+                skipped_episodes.append(skip_key)
+                return False
+            episodes_to_add.append({'ids': {'trakt': trakt_id}})
+            episodes_to_add_names.append(name)
+            return True
+
         # Step 4: Process all episodes based on match_by parameter
         with Progress(
             TextColumn("[bold blue]{task.description}"),
@@ -754,6 +1084,8 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
                 if special_anime:
                     episode = handle_special_anime_titles(anime_name, episode)
 
+                name = episode['name']
+
                 # Try number matching first if "number" or "hybrid"
                 if match_by in ["number", "hybrid"]:
                     episode_number = episode['number']
@@ -762,161 +1094,108 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
                     trakt_data = None
 
                     # Try direct match
-                    if episode_number in episode_by_number:
-                        trakt_data = episode_by_number[episode_number]
+                    if episode_number.isdecimal():
+                        trakt_data = episode_by_number.get(int(episode_number))
                     else:
-                        # Try as an integer in case of formatting differences
-                        try:
-                            # Remove any non-digit characters
-                            clean_number = re.sub(r'\D', '', episode_number)
-                            if clean_number in episode_by_number:
-                                trakt_data = episode_by_number[clean_number]
-                        except:
-                            pass
+                        # Not a plain number - remove any non-digit characters
+                        clean_number = _RE_DIGITS.sub('', episode_number)
+                        if clean_number:
+                            trakt_data = episode_by_number.get(int(clean_number))
 
                     if trakt_data:
-                        trakt_id = trakt_data['trakt_id']
-                        if trakt_id not in existing_trakt_ids:
-                            episodes_to_add.append({
-                                'ids': {'trakt': trakt_id},
-                                'name': episode['name']
-                            })
-                        else:
-                            skipped_episodes.append(episode_number)
+                        record_match(trakt_data['trakt_id'], name, episode_number)
                         matched = True
 
                 # Fall back to title matching if number matching didn't work or using title mode
                 if not matched and (match_by == "title" or match_by == "hybrid"):
                     # The existing title-based matching code stays the same
-                    episode_title = episode['name'].lower()
+                    episode_title = name.lower()
 
                     # Apply any title mappings
                     mapped_title = episode_title
-                    title_mappings = config_data.get('title_mappings', {}) or {}
-                    anime_mapping = title_mappings.get(anime_name, {}) or {}
-                    
-                    if anime_mapping and 'special_matches' in anime_mapping:
-                        special_match = anime_mapping['special_matches'].get(episode_title)
-                        if special_match:
-                            # CRITICAL: Remove "Episode: " prefix from mappings if present
-                            mapped_title = special_match.lower()
-                            if mapped_title.startswith("episode: "):
-                                mapped_title = mapped_title[9:]  # Remove "Episode: " prefix
-                            logger.info(f"Applied mapping: '{episode_title}' → '{mapped_title}'")
+                    special_match = special_matches.get(episode_title)
+                    if special_match:
+                        # CRITICAL: Remove "Episode: " prefix from mappings if present
+                        mapped_title = special_match.lower()
+                        if mapped_title.startswith("episode: "):
+                            mapped_title = mapped_title[9:]  # Remove "Episode: " prefix
+                        logger.info(f"Applied mapping: '{episode_title}' → '{mapped_title}'")
+
+                    # Normalized form is used by both the normalized and fuzzy passes
+                    normalized_title = normalize_episode_title(mapped_title)
 
                     # Try multiple approaches to find a match
                     matched = False
 
                     # 1. Direct match
                     if mapped_title in episode_by_title:
-                        trakt_id = episode_by_title[mapped_title]['trakt_id']
-                        if trakt_id not in existing_trakt_ids:
-                            episodes_to_add.append({
-                                'ids': {'trakt': trakt_id},
-                                'name': episode['name']
-                            })
-                        else:
-                            skipped_episodes.append(episode_title)
+                        record_match(episode_by_title[mapped_title]['trakt_id'], name, episode_title)
                         matched = True
 
                     # 2. Normalized match (removing punctuation, etc.)
                     if not matched:
-                        normalized_title = normalize_episode_title(mapped_title)
                         if normalized_title in episode_by_title:
-                            trakt_id = episode_by_title[normalized_title]['trakt_id']
-                            if trakt_id not in existing_trakt_ids:
-                                episodes_to_add.append({
-                                    'ids': {'trakt': trakt_id},
-                                    'name': episode['name']
-                                })
-                            else:
-                                skipped_episodes.append(episode_title)
+                            record_match(episode_by_title[normalized_title]['trakt_id'], name, episode_title)
                             matched = True
 
                     # Special pattern matching for Code Geass
-                    if not matched and special_anime and anime_name.lower() in ['code-geass', 'code-geass-lelouch-of-the-rebellion']:
-                        episode_title = episode['name']
+                    # special_anime is only set for the Code Geass names
+                    if not matched and special_anime:
+                        episode_title = name
 
                         # Check if this is a Stage/Turn format title
-                        stage_match = re.match(r'Stage (\d+)(?:\s*-\s*)?(.+)?', episode_title)
-                        turn_match = re.match(r'Turn (\d+)(?:\s*-\s*)?(.+)?', episode_title)
-                        final_match = re.match(r'Final Turn(?:\s*-\s*)?(.+)?', episode_title)
+                        cg_match = _RE_CG.match(episode_title)
 
                         ep_num = None
                         pure_title = None
 
-                        if stage_match:
-                            ep_num = int(stage_match.group(1))
-                            pure_title = stage_match.group(2) if stage_match.group(2) else f"Episode {ep_num}"
-                            season = 1
-                        elif turn_match:
-                            ep_num = int(turn_match.group(1))
-                            pure_title = turn_match.group(2) if turn_match.group(2) else f"Episode {ep_num}"
-                            season = 2
-                        elif final_match:
+                        if cg_match and cg_match.group(1):
+                            ep_num = int(cg_match.group(2))
+                            pure_title = cg_match.group(3) if cg_match.group(3) else f"Episode {ep_num}"
+                            season = 1 if cg_match.group(1) == 'Stage' else 2
+                        elif cg_match:
                             ep_num = 25  # Final episode of season 2
-                            pure_title = final_match.group(1) if final_match.group(1) else "Re;"
+                            pure_title = cg_match.group(3) if cg_match.group(3) else "Re;"
                             season = 2
 
                         if ep_num:
                             # Directly match by season and episode number
-                            for season_data in all_seasons:
-                                if season_data.get('number') == season:
-                                    for ep_data in season_data.get('episodes', []):
-                                        if ep_data.get('number') == ep_num:
-                                            trakt_id = ep_data.get('ids', {}).get('trakt')
-                                            if trakt_id and trakt_id not in existing_trakt_ids:
-                                                episodes_to_add.append({
-                                                    'ids': {'trakt': trakt_id},
-                                                    'name': episode['name']
-                                                })
-                                                logger.info(f"Matched Code Geass {episode_title} → S{season}E{ep_num}")
-                                                matched = True
-                                                break
-                                    if matched:
-                                        break
+                            ep_data = season_ep_index.get((season, ep_num))
+                            trakt_id = (ep_data.get('ids') or _EMPTY).get('trakt') if ep_data else None
+                            if trakt_id:
+                                if record_match(trakt_id, name, episode_title):
+                                    logger.info(f"Matched Code Geass {episode_title} → S{season}E{ep_num}")
+                                matched = True
 
                         # Try matching by title if number matching didn't work
                         if not matched and pure_title:
                             normalized_pure = normalize_episode_title(pure_title)
-                            for title in episode_by_title.keys():
-                                if normalized_pure == title or pure_title.lower() == title:
-                                    trakt_id = episode_by_title[title]['trakt_id']
-                                    if trakt_id not in existing_trakt_ids:
-                                        episodes_to_add.append({
-                                            'ids': {'trakt': trakt_id},
-                                            'name': episode['name']
-                                        })
-                                        logger.info(f"Matched Code Geass {episode_title} → {title} by pure title")
-                                        matched = True
-                                        break
+                            pure_lower = pure_title.lower()
+                            title = normalized_pure if normalized_pure in episode_by_title else pure_lower
+                            hit = episode_by_title.get(title)
+                            if hit:
+                                if record_match(hit['trakt_id'], name, episode_title):
+                                    logger.info(f"Matched Code Geass {episode_title} → {title} by pure title")
+                                matched = True
 
                     # 3. Fuzzy matching as a last resort
                     if not matched:
                         best_match = None
-                        best_score = 0.85  # Higher threshold for confidence
+                        best_score = 0
 
-                        for title in episode_by_title.keys():
-                            # Use sequence matcher for fuzzy matching
-                            similarity = difflib.SequenceMatcher(None, normalized_title, title).ratio()
-                            if similarity > best_score:
-                                best_score = similarity
-                                best_match = title
+                        # Higher threshold (85%) for confidence
+                        fuzzy_match = process.extractOne(normalized_title, title_keys, scorer=fuzz.ratio, score_cutoff=85)
+                        if fuzzy_match:
+                            best_match = fuzzy_match[0]
+                            best_score = fuzzy_match[1] / 100
 
                         if best_match:
-                            trakt_id = episode_by_title[best_match]['trakt_id']
-                            if trakt_id not in existing_trakt_ids:
-                                episodes_to_add.append({
-                                    'ids': {'trakt': trakt_id},
-                                    'name': episode['name']
-                                })
+                            if record_match(episode_by_title[best_match]['trakt_id'], name, episode_title):
                                 logger.info(f"Fuzzy matched '{mapped_title}' to '{best_match}' (score: {best_score:.2f})")
-                            else:
-                                skipped_episodes.append(episode_title)
                             matched = True
 
                     if not matched:
-                        failed_episodes.append(episode)
+                        failed_episodes.append(name)
                         failure_details.append(f"Failed to find match for {episode_title}")
 
                 # Update progress
@@ -927,10 +1206,62 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
         if episodes_to_add:
             add_items_url = f"{trakt_api_url}/users/{trakt_username}/lists/{list_id}/items"
 
-            # Process in batches of 10 to avoid rate limits
-            batch_size = 10
+            # Trakt accepts many items per request, so only split very large lists
+            batch_size = TRAKT_BATCH_SIZE
+            batch_starts = range(0, len(episodes_to_add), batch_size)
             console.print(f"\n[bold]Adding {len(episodes_to_add)} episodes in batches...[/bold]")
 
+            last_post = 0.0
+
+            def post_batch(start):
+                """POST one batch, retrying on rate limits. Returns (success, failure detail).
+
+                Batches are posted one at a time, at most one POST per
+                TRAKT_POST_INTERVAL, and a 429 waits for the server's Retry-After.
+                """
+                nonlocal last_post
+                batch_number = start // batch_size + 1
+                # The stored items are already in payload shape - just the trakt IDs
+                episode_payload = {
+                    'episodes': episodes_to_add[start:start+batch_size],
+                    'type': 'show'
+                }
+
+                body = _dumps_json(episode_payload)
+
+                # Try with retries for rate limits
+                max_retries = 3
+                retry_delay = 1  # Start with 1 second delay
+
+                for attempt in range(max_retries):
+                    # Keep POSTs spaced out to stay under Trakt's write limit
+                    wait = last_post + TRAKT_POST_INTERVAL - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+
+                    # headers already carry Content-Type: application/json
+                    response = _SESSION.post(add_items_url, headers=headers, data=body, timeout=HTTP_TIMEOUT)
+                    last_post = time.monotonic()
+
+                    if response.status_code == 201:
+                        return True, None
+                    elif response.status_code != 429:
+                        # Other error
+                        return False, f"Failed to add batch {batch_number} - Status {response.status_code}: {response.text}"
+
+                    # Rate limited - honour Retry-After, falling back to exponential
+                    # backoff (no wait after the last attempt)
+                    if attempt < max_retries - 1:
+                        try:
+                            delay = max(int(response.headers.get('Retry-After', retry_delay)), retry_delay)
+                        except (ValueError, TypeError):
+                            delay = retry_delay
+                        logger.info(f"Rate limit hit, retrying batch {batch_number} in {delay}s...")
+                        time.sleep(delay)
+                        retry_delay *= 2  # Exponential backoff
+
+                return False, f"Failed to add batch {batch_number} - Rate limit retries exhausted"
+
             with Progress(
                 TextColumn("[bold blue]{task.description}"),
                 BarColumn(),
@@ -938,49 +1269,15 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
             ) as progress:
                 batch_task = progress.add_task("[cyan]Adding episodes...", total=len(episodes_to_add))
 
-                for i in range(0, len(episodes_to_add), batch_size):
-                    batch = episodes_to_add[i:i+batch_size]
-
-                    # Prepare the payload - just the trakt IDs
-                    episode_payload = {
-                        'episodes': [{'ids': {'trakt': ep['ids']['trakt']}} for ep in batch],
-                        'type': 'show'
-                    }
-
-                    # Try with retries for rate limits
-                    max_retries = 3
-                    retry_count = 0
-                    retry_delay = 1  # Start with 1 second delay
-
-                    while retry_count < max_retries:
-                        response = requests.post(add_items_url, headers=headers, json=episode_payload)
-
-                        if response.status_code == 201:
-                            # Success - add to added_episodes
-                            for ep in batch:
-                                added_episodes.append(ep['name'])
-                            progress.update(batch_task, advance=len(batch))
-                            time.sleep(0.5)  # Small delay between batches
-                            break
-                        elif response.status_code == 429:
-                            # Rate limited - wait and retry with exponential backoff
-                            retry_count += 1
-                            progress.update(batch_task, description=f"Rate limit hit, retrying batch {i//batch_size + 1} in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                        else:
-                            # Other error
-                            failure_details.append(f"Failed to add batch {i//batch_size + 1} - Status {response.status_code}: {response.text}")
-                            for ep in batch:
-                                failed_episodes.append(ep)
-                            progress.update(batch_task, advance=len(batch))
-                            break
-
-                    if retry_count == max_retries:
-                        failure_details.append(f"Failed to add batch {i//batch_size + 1} - Rate limit retries exhausted")
-                        for ep in batch:
-                            failed_episodes.append(ep)
-                        progress.update(batch_task, advance=len(batch))
+                for start in batch_starts:
+                    success, detail = post_batch(start)
+                    batch_names = episodes_to_add_names[start:start+batch_size]
+                    if success:
+                        added_episodes.extend(batch_names)
+                    else:
+                        failure_details.append(detail)
+                        failed_episodes.extend(batch_names)
+                    progress.update(batch_task, advance=len(batch_names))
 
         # Step 6: Display summary and handle notifications
         console.print("\n[bold green]Summary:[/bold green]")
@@ -1020,8 +1317,7 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
             # Only log failures in regular mode, not update mode
             # to prevent duplicate entries for the same episodes
             console.print("\n[bold yellow]Failed Episodes:[/bold yellow]")
-            for i, episode in enumerate(failed_episodes[:5], 1):
-                episode_name = episode['name'] if isinstance(episode, dict) else str(episode)
+            for i, episode_name in enumerate(failed_episodes[:5], 1):
                 console.print(f"[yellow]{i}. {episode_name}[/yellow]")
 
             # Log failures to file - only in non-update mode
@@ -1040,19 +1336,20 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
                 afl_name = anime_name if anime_name else "unknown"
                 episode_type_value = episode_type if episode_type else "unknown"
 
+                # Build the entry first so it is appended with a single write
+                parts = [
+                    f"\n--- {timestamp} ---\n",
+                    f"Anime: {afl_name}\n",
+                    f"Episode Type: {episode_type_value}\n",
+                    f"Failed Episodes: {len(failed_episodes)}\n"
+                ]
+                parts.extend(f"{i}. {episode_name}\n" for i, episode_name in enumerate(failed_episodes, 1))
+                # DO NOT write details to the log - only send in notifications
+                parts.append("---\n")
+
                 # Write to log file
                 with open(log_file, "a") as f:
-                    f.write(f"\n--- {timestamp} ---\n")
-                    f.write(f"Anime: {afl_name}\n")
-                    f.write(f"Episode Type: {episode_type_value}\n")
-                    f.write(f"Failed Episodes: {len(failed_episodes)}\n")
-
-                    for i, episode in enumerate(failed_episodes, 1):
-                        episode_name = episode['name'] if isinstance(episode, dict) else str(episode)
-                        f.write(f"{i}. {episode_name}\n")
-
-                    # DO NOT write details to the log - only send in notifications
-                    f.write("---\n")
+                    f.write("".join(parts))
 
                 console.print(f"[blue]Failures logged to {log_file}[/blue]")
 
@@ -1069,7 +1366,7 @@ def add_episodes_to_trakt_list(list_id, episodes, access_token, trakt_show_id, m
                         notifications.notify_mapping_errors(
                             afl_name,
                             episode_type_value,
-                            [ep['name'] if isinstance(ep, dict) else str(ep) for ep in failed_episodes],
+                            failed_episodes,
                             failure_details
                         )
                     except Exception as e:
@@ -1098,13 +1395,14 @@ def format_trakt_url(username, list_name):
     url_name = url_name.replace('/', '-')
 
     # Replace any other URL-unsafe characters
-    url_name = re.sub(r'[^\w\-]', '', url_name)
+    url_name = _RE_URL_UNSAFE.sub('', url_name)
 
     return f"https://trakt.tv/users/{username}/lists/{url_name}"
 
+@functools.lru_cache(maxsize=1024)
 def format_anime_name(anime_name):
     """Format anime name for API usage."""
-    formatted_name = re.sub(r'\s+', '-', anime_name).lower()
+    formatted_name = _RE_WS.sub('-', anime_name).lower()
     return formatted_name
 
 def log_failed_episodes(anime_name, episode_type, failed_episodes, details=None):
@@ -1121,27 +1419,28 @@ def log_failed_episodes(anime_name, episode_type, failed_episodes, details=None)
 
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
-        with open(log_file, "a") as f:
-            f.write(f"\n--- {timestamp} ---\n")
-            f.write(f"Anime: {anime_name}\n")
-            f.write(f"Episode Type: {episode_type}\n")
-            f.write(f"Failed Episodes: {len(failed_episodes)}\n")
-
-            for i, episode in enumerate(failed_episodes, 1):
-                f.write(f"{i}. {episode}\n")
-
-            # Handle details parameter safely regardless of type
-            if details is not None:
-                f.write("Details:\n")
-                # If details is a list, iterate through it
-                if isinstance(details, list):
-                    for detail in details:
-                        f.write(f"- {detail}\n")
-                else:
-                    # If it's not a list, just write it as a single item
-                    f.write(f"- {str(details)}\n")
+        parts = [
+            f"\n--- {timestamp} ---\n",
+            f"Anime: {anime_name}\n",
+            f"Episode Type: {episode_type}\n",
+            f"Failed Episodes: {len(failed_episodes)}\n"
+        ]
+        parts.extend(f"{i}. {episode}\n" for i, episode in enumerate(failed_episodes, 1))
+
+        # Handle details parameter safely regardless of type
+        if details is not None:
+            parts.append("Details:\n")
+            # If details is a list, iterate through it
+            if isinstance(details, list):
+                parts.extend(f"- {detail}\n" for detail in details)
+            else:
+                # If it's not a list, just write it as a single item
+                parts.append(f"- {str(details)}\n")
 
-            f.write("---\n")
+        parts.append("---\n")
+
+        with open(log_file, "a") as f:
+            f.write("".join(parts))
 
         # Skip the notification code for now until it's properly configured
         logger.info(f"Logged {len(failed_episodes)} failed episodes for {anime_name}")
@@ -1160,10 +1459,11 @@ def find_anime_on_animefillerlist(plex_title, all_afl_shows):
     plex_title_lower = plex_title.lower()
 
     # Create different variations to check
+    title_words = plex_title_lower.split()
     variations = [
         plex_title_lower,  # Full title
-        plex_title_lower.split(':')[0].strip() if ':' in plex_title_lower else plex_title_lower,  # Before colon
-        ' '.join(plex_title_lower.split()[:2]) if len(plex_title_lower.split()) > 2 else plex_title_lower,  # First two words
+        plex_title_lower.partition(':')[0].strip() if ':' in plex_title_lower else plex_title_lower,  # Before colon
+        ' '.join(title_words[:2]) if len(title_words) > 2 else plex_title_lower,  # First two words
     ]
 
     console.print(f"[dim]Looking for matches to: {plex_title}[/dim]")
@@ -1174,15 +1474,20 @@ def find_anime_on_animefillerlist(plex_title, all_afl_shows):
     for afl_show in all_afl_shows:
         display_name = afl_show.replace('-', ' ')
 
-        # Calculate similarity for each variation
-        best_variation_score = 0
-        for variation in variations:
-            similarity = difflib.SequenceMatcher(None, display_name, variation).ratio()
-            best_variation_score = max(best_variation_score, similarity)
+        # Identical strings need no scoring
+        if display_name in variations:
+            return [(afl_show, 1.0)]
+
+        # Best similarity across all variations; with a cutoff RapidFuzz bails
+        # out early on pairs whose lengths already rule out a 0.6 ratio
+        best_variation = process.extractOne(display_name, variations, scorer=fuzz.ratio, score_cutoff=60)
+        if best_variation is None:
+            continue
+        best_variation_score = best_variation[1] / 100
 
-            # If we have an exact match or very close match for any variation, this is likely it
-            if display_name == variation or similarity > 0.9:
-                return [(afl_show, 1.0)]
+        # If we have an exact match or very close match for any variation, this is likely it
+        if best_variation_score > 0.9:
+            return [(afl_show, 1.0)]
 
         # Add to matches if score is above threshold
         if best_variation_score > 0.6:
@@ -1193,8 +1498,12 @@ def find_anime_on_animefillerlist(plex_title, all_afl_shows):
 
     return best_matches
 
+@functools.lru_cache(maxsize=2048)
 def generate_variations(title):
-    """Generate multiple variations of a title for matching."""
+    """Generate multiple variations of a title for matching.
+
+    Returns a tuple so the cached result can be shared between callers.
+    """
     variations = []
 
     # Clean the title first - lowercase and remove some punctuation
@@ -1232,13 +1541,14 @@ def generate_variations(title):
     if not is_sequel:
         # Handle colons better - create variations with and without the colon
         if ':' in clean_title:
+            # Split once around the first colon
+            before_colon, _, after_colon = clean_title.partition(':')
+
             # Before colon
-            before_colon = clean_title.split(':', 1)[0].strip()
-            variations.append(before_colon)
+            variations.append(before_colon.strip())
 
             # After colon
-            after_colon = clean_title.split(':', 1)[1].strip()
-            variations.append(after_colon)
+            variations.append(after_colon.strip())
 
             # Replace colon with space
             no_colon = clean_title.replace(':', ' ').strip()
@@ -1264,10 +1574,8 @@ def generate_variations(title):
                 variations.append(words[0])
 
     # Base title (remove common articles)
-    simplified = clean_title
-    for word in ['the', 'a', 'an', 'of', 'and']:
-        simplified = re.sub(r'\b' + word + r'\b', '', simplified)
-    simplified = re.sub(r'\s+', ' ', simplified).strip()
+    simplified = _RE_ARTICLES.sub('', clean_title)
+    simplified = _RE_WS.sub(' ', simplified).strip()
     if simplified != clean_title and simplified not in variations:
         variations.append(simplified)
 
@@ -1277,9 +1585,11 @@ def generate_variations(title):
         variations.append(' '.join(key_words))
 
     # Ensure unique variations, keep order of precedence
+    seen = set()
     unique_variations = []
     for v in variations:
-        if v and v not in unique_variations:
+        if v and v not in seen:
+            seen.add(v)
             unique_variations.append(v)
             
     # For sequels, always make sure the full name is first
@@ -1290,7 +1600,90 @@ def generate_variations(title):
         # Add to front of list
         unique_variations.insert(0, clean_title)
 
-    return unique_variations
+    return tuple(unique_variations)
+
+@functools.lru_cache(maxsize=4)
+def _normalized_afl(afl_shows):
+    """Precompute comparison forms of the AnimeFillerList catalog.
+
+    Args:
+        afl_shows: Tuple of AnimeFillerList names
+
+    Returns:
+        (display, normalized_to_afl, display_to_afl) where display maps each
+        name to its spaced form, and the two reverse indexes map the
+        lowercased/macron-folded form and the display form back to the first
+        AFL name (in catalog order) that produces it.
+    """
+    display = {}
+    normalized_to_afl = {}
+    display_to_afl = {}
+    for name in afl_shows:
+        display_name = name.replace('-', ' ')
+        display[name] = display_name
+        normalized = display_name.lower().replace('ū', 'u').replace('ō', 'o')
+        normalized_to_afl.setdefault(normalized, name)
+        display_to_afl.setdefault(display_name, name)
+    return display, normalized_to_afl, display_to_afl
+
+@functools.lru_cache(maxsize=256)
+def _afl_names_containing(display_name, afl_shows):
+    """Return display names in the AFL catalog that contain display_name.
+
+    Only longer names can contain it, so shorter ones are skipped without a
+    substring scan.
+    """
+    afl_display = _normalized_afl(afl_shows)[0]
+    return tuple(
+        other_name for other_name in afl_display.values()
+        if len(other_name) > len(display_name) and display_name in other_name
+    )
+
+@functools.lru_cache(maxsize=4)
+def _afl_word_index(afl_shows):
+    """Map each word of the AFL display names to the shows that contain it.
+
+    Shows are identified by their position in the _normalized_afl() display
+    map, so postings stay in catalog order.
+    """
+    word_index = {}
+    for show_index, display_name in enumerate(_normalized_afl(afl_shows)[0].values()):
+        for word in set(display_name.split()):
+            word_index.setdefault(word, []).append(show_index)
+    return word_index
+
+@functools.lru_cache(maxsize=4)
+def _afl_word_bits(afl_shows):
+    """Give each AFL display-name word its own bit and each show a word bitmap.
+
+    Returns (word_bits, show_bits): word_bits maps a word to its bit, and
+    show_bits holds each show's OR-ed word bits in _normalized_afl() order.
+    """
+    word_bits = {}
+    show_bits = []
+    for display_name in _normalized_afl(afl_shows)[0].values():
+        bits = 0
+        for word in display_name.split():
+            if word not in word_bits:
+                word_bits[word] = 1 << len(word_bits)
+            bits |= word_bits[word]
+        show_bits.append(bits)
+    return word_bits, show_bits
+
+def _variation_scores(variations, choices, score_cutoff=0):
+    """Score every variation against every choice with fuzz.ratio.
+
+    Each variation is scored against all choices in a single RapidFuzz call.
+    Returns one list per variation holding each choice's similarity (0-1);
+    choices scoring below score_cutoff (0-100) are reported as 0.
+    """
+    matrix = []
+    for variation in variations:
+        row = [0.0] * len(choices)
+        for _, score, index in process.extract(variation, choices, scorer=fuzz.ratio, limit=None, score_cutoff=score_cutoff):
+            row[index] = score / 100
+        matrix.append(row)
+    return matrix
 
 def find_best_anime_match(plex_title, all_afl_shows):
     """Find best match using similarity ranking across all potential matches."""
@@ -1300,76 +1693,128 @@ def find_best_anime_match(plex_title, all_afl_shows):
     variations = generate_variations(plex_title)
     console.print(f"[dim]Trying variations: {', '.join(variations)}[/dim]")
 
-    # Convert AFL shows to display format for comparison
-    afl_display = {name: name.replace('-', ' ') for name in all_afl_shows}
+    # Convert AFL shows to display format for comparison (cached per catalog)
+    afl_shows = tuple(all_afl_shows)
+    afl_display, normalized_to_afl, display_to_afl = _normalized_afl(afl_shows)
 
     # Track all potential matches with their best similarity score
     all_potential_matches = []
 
     # 1. First try exact match on the full original title (highest priority)
-    normalized_full_title = plex_title.lower().replace('ū', 'u').replace('ō', 'o')
-    for afl_name, display_name in afl_display.items():
-        # Try both the original display name and a simplified version
-        simplified_name = display_name.lower().replace('ū', 'u').replace('ō', 'o')
-        if normalized_full_title == simplified_name:
-            console.print(f"[green]Found exact match on full title: {afl_name}[/green]")
-            return afl_name  # Immediate return for exact full matches
+    plex_title_lower = plex_title.lower()
+    normalized_full_title = plex_title_lower.replace('ū', 'u').replace('ō', 'o')
+    afl_name = normalized_to_afl.get(normalized_full_title)
+    if afl_name is not None:
+        console.print(f"[green]Found exact match on full title: {afl_name}[/green]")
+        return afl_name  # Immediate return for exact full matches
 
     # 2. Try exact matches on variations, but prioritize longer matches
     variations_by_length = sorted(variations, key=len, reverse=True)
     for variation in variations_by_length:
-        for afl_name, display_name in afl_display.items():
-            if variation == display_name:
-                # For exact variation matches, make sure it's not just a substring of a longer name
-                # For example, "naruto" should not match if "naruto shippuden" is available
-                potential_longer_match = False
-                for other_name in afl_display.values():
-                    if display_name != other_name and display_name in other_name:
-                        # Check if this longer name is a better match for our plex_title
-                        if difflib.SequenceMatcher(None, plex_title.lower(), other_name).ratio() > 0.8:
-                            potential_longer_match = True
-                            break
-                
-                if not potential_longer_match:
-                    console.print(f"[green]Found exact match: {afl_name}[/green]")
-                    return afl_name  # Immediate return for exact matches without longer alternatives
+        afl_name = display_to_afl.get(variation)
+        if afl_name is not None:
+            display_name = variation
+            # For exact variation matches, make sure it's not just a substring of a longer name
+            # For example, "naruto" should not match if "naruto shippuden" is available
+            potential_longer_match = False
+            for other_name in _afl_names_containing(display_name, afl_shows):
+                # Check if this longer name is a better match for our plex_title
+                if fuzz.ratio(plex_title_lower, other_name) > 80:
+                    potential_longer_match = True
+                    break
+
+            if not potential_longer_match:
+                console.print(f"[green]Found exact match: {afl_name}[/green]")
+                return afl_name  # Immediate return for exact matches without longer alternatives
+
+    # Word sets of each variation don't depend on the show, so split them once.
+    # Words outside the AFL vocabulary get bits past it so subset checks
+    # against show bitmaps stay exact.
+    word_bits, show_bits = _afl_word_bits(afl_shows)
+    extra_bits = {}
+    variation_info = []
+    for variation in variations:
+        title_words = set(variation.split())
+        variation_bits = 0
+        for word in title_words:
+            bit = word_bits.get(word)
+            if bit is None:
+                bit = extra_bits.setdefault(word, 1 << (len(word_bits) + len(extra_bits)))
+            variation_bits |= bit
+        variation_info.append((variation, title_words, len(variation.split()) >= 2, variation_bits))
+
+    # 3. Only shows sharing two words with a variation can get a subset bonus,
+    # and any other show needs a raw similarity of at least the threshold, so
+    # every remaining show is skipped without scoring
+    display_names = list(afl_display.values())
+    word_index = _afl_word_index(afl_shows)
+    shows_to_score = set()
+    for variation, title_words, _, _ in variation_info:
+        word_counts = {}
+        for word in title_words:
+            for show_index in word_index.get(word, ()):
+                word_counts[show_index] = word_counts.get(show_index, 0) + 1
+        shows_to_score.update(show_index for show_index, count in word_counts.items() if count >= 2)
+        shows_to_score.update(
+            show_index for _, _, show_index in
+            process.extract(variation, display_names, scorer=fuzz.ratio, limit=None, score_cutoff=70)
+        )
+
+    # Score the remaining shows against each variation in one RapidFuzz call.
+    # The bonuses add at most 0.4, so a pair under 0.3 can never reach the 0.7
+    # threshold; those pairs are dropped, and shows left with no pair at all
+    # are never looked at.
+    choices = {show_index: display_names[show_index] for show_index in shows_to_score}
+    scores = [
+        {show_index: score / 100 for _, score, show_index in
+         process.extract(variation, choices, scorer=fuzz.ratio, limit=None, score_cutoff=30)}
+        for variation in variations
+    ]
+
+    afl_names = list(afl_display)
+    for show_index in sorted(set().union(*scores)):
+        afl_name = afl_names[show_index]
 
-    # 3. Calculate similarity scores for all shows against all variations
-    for afl_name, display_name in afl_display.items():
         # Track best score for this show across all variations
         best_score = 0
         best_variation = ""
         match_type = "word"  # Default match type
 
-        # Check different matching methods
-        for variation in variations:
-            # 3a. Word-subset matching
-            afl_words = set(display_name.split())
-            title_words = set(variation.split())
+        afl_bits = show_bits[show_index]
+        # x & (x - 1) clears the lowest set bit, so it is non-zero only when
+        # at least two words are present
+        afl_multi_word = bool(afl_bits & (afl_bits - 1))
 
+        # Check different matching methods
+        for variation_index, (variation, _, variation_multi_word, variation_bits) in enumerate(variation_info):
+            # 3a. Word-subset matching on the word bitmaps
             is_subset_match = False
             # Need at least 2 words in common for a valid subset match
-            common_words = afl_words.intersection(title_words)
+            common_bits = afl_bits & variation_bits
 
-            if len(common_words) >= 2:
-                if afl_words.issubset(title_words) or title_words.issubset(afl_words):
+            # Most pairs share fewer than two words; the bit trick rules them
+            # out before the common words are counted
+            if common_bits & (common_bits - 1):
+                if common_bits == afl_bits or common_bits == variation_bits:
                     is_subset_match = True
+                    common_count = bin(common_bits).count('1')
 
             # 3b. Sequence similarity score
-            similarity = difflib.SequenceMatcher(None, display_name, variation).ratio()
+            similarity = scores[variation_index].get(show_index, 0)
 
             # Boost score for subset matches
-            if is_subset_match and len(common_words) > 1:
+            if is_subset_match and common_count > 1:
                 # Words in common provide a bonus
-                word_bonus = min(0.3, len(common_words) * 0.1)  # Cap at 0.3
+                word_bonus = common_count * 0.1 if common_count < 3 else 0.3  # Cap at 0.3
                 adjusted_similarity = similarity + word_bonus
 
                 # Extra boost if it's the main part (not small variations)
-                if len(variation.split()) >= 2 and len(afl_words) >= 2:
+                if variation_multi_word and afl_multi_word:
                     adjusted_similarity += 0.1
 
                 # Cap at 0.99 to keep exact matches higher
-                adjusted_similarity = min(0.99, adjusted_similarity)
+                if adjusted_similarity > 0.99:
+                    adjusted_similarity = 0.99
 
                 if adjusted_similarity > best_score:
                     best_score = adjusted_similarity
@@ -1388,6 +1833,11 @@ def find_best_anime_match(plex_title, all_afl_shows):
         if best_score >= threshold:
             all_potential_matches.append((afl_name, best_score, match_type, best_variation))
 
+            # A raw similarity of 1.0 is an exact variation match; nothing later
+            # in the catalog can outrank it (subset scores are capped at 0.99)
+            if best_score >= 1.0:
+                break
+
     # Sort all matches by score (highest first)
     all_potential_matches.sort(key=lambda x: x[1], reverse=True)
 
@@ -1415,18 +1865,17 @@ def find_best_anime_match(plex_title, all_afl_shows):
 def suggest_matches(plex_title, all_afl_shows, max_suggestions=5):
     """Find and suggest potential matches for manual selection."""
     # Convert AFL shows to display format for comparison
-    afl_display = {name: name.replace('-', ' ') for name in all_afl_shows}
+    afl_display = _normalized_afl(tuple(all_afl_shows))[0]
 
     # Generate variations of the Plex title
     variations = generate_variations(plex_title)
 
     # Calculate similarity scores
+    scores = _variation_scores(variations, list(afl_display.values()), score_cutoff=40)
+
     matches = []
-    for afl_name, display_name in afl_display.items():
-        best_score = 0
-        for variation in variations:
-            similarity = difflib.SequenceMatcher(None, display_name, variation).ratio()
-            best_score = max(best_score, similarity)
+    for show_index, afl_name in enumerate(afl_display):
+        best_score = max((row[show_index] for row in scores), default=0)
 
         if best_score > 0.4:  # Lower threshold for suggestions
             matches.append((afl_name, best_score))
@@ -1454,6 +1903,80 @@ def clear_error_log():
     except Exception as e:
         logger.error(f"Error clearing error log: {str(e)}")
 
+# Header tags of failed_episodes.log entry lines, keyed by the text before ':'
+_LOG_TAGS = {
+    'Anime': 'anime',
+    'Episode Type': 'type',
+    'Failed Episodes': 'episodes',
+    'Details': 'details',
+}
+# Numbered episode lines ("3. Title"); the group is everything after the first ". "
+_RE_LOG_EPISODE = re.compile(r'\d.*?\. (.*)', re.DOTALL)
+
+# Trakt list types by the keyword that identifies them, in the order they are
+# preferred when several appear (e.g. 'mixed canon/filler' is FILLER)
+_EPISODE_TYPE_KEYWORDS = (('anime', 'ANIME'), ('manga', 'MANGA'), ('filler', 'FILLER'), ('mixed', 'MIXED'))
+_RE_EPISODE_TYPE = re.compile(r'anime|manga|filler|mixed', re.IGNORECASE)
+# Code Geass style episode titles ("Stage 3", "Turn 12") mark anime canon
+_RE_STAGE_TURN = re.compile(r'stage|turn', re.IGNORECASE)
+
+def _classify_episode_type(text):
+    """Map an episode type or list name to its Trakt list type, or None."""
+    found = {keyword.lower() for keyword in _RE_EPISODE_TYPE.findall(text)}
+    if not found:
+        return None
+    for keyword, trakt_type in _EPISODE_TYPE_KEYWORDS:
+        if keyword in found:
+            return trakt_type
+
+def _read_log_lines(path, chunk_size=1 << 20):
+    """Yield the lines of a log file without their line endings.
+
+    The file is read in large binary chunks and split with bytes.splitlines(),
+    which breaks on the same '\\n', '\\r' and '\\r\\n' endings as text mode.
+    """
+    tail = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            pieces = (tail + chunk).splitlines(True)
+            # The last piece may continue in the next chunk; a trailing '\r'
+            # is held back too in case its '\n' starts the next chunk
+            tail = pieces.pop() if not pieces[-1].endswith(b'\n') else b''
+            for piece in pieces:
+                yield piece.rstrip(b'\r\n').decode('utf-8', 'replace')
+    if tail:
+        yield tail.rstrip(b'\r\n').decode('utf-8', 'replace')
+
+def _iter_log_entries(lines):
+    """Group failed_episodes.log lines into entries delimited by '---' lines.
+
+    Lines outside an entry are dropped; a closing '---' line opens the next
+    group, so each entry after the first starts with the previous closer.
+    """
+    current_entry = []
+    in_entry = False
+
+    for line in lines:
+        if line.startswith('---'):
+            if in_entry:
+                # End of entry
+                yield current_entry
+                current_entry = []
+                in_entry = False
+            else:
+                # Start of entry
+                in_entry = True
+
+        if in_entry or line.startswith('---'):
+            current_entry.append(line)
+
+    # Partial entry at the end
+    if current_entry:
+        yield current_entry
+
 def clean_error_log(anime_name, episode_type, fixed_episodes):
     """Remove fixed episodes from the error log while preserving other entries."""
     try:
@@ -1467,40 +1990,14 @@ def clean_error_log(anime_name, episode_type, fixed_episodes):
             logger.warning(f"Error log file not found: {log_file}")
             return False
 
-        # Create a backup of the original log
-        backup_file = os.path.join(data_dir, "failed_episodes.log.bak")
         import shutil
-        shutil.copy2(log_file, backup_file)
-
-        # Read the log file
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-
-        # Parse the log file into entries
-        entries = []
-        current_entry = []
-        in_entry = False
-
-        for line in lines:
-            if line.startswith('---'):
-                if in_entry:
-                    # End of entry, add it to our list
-                    entries.append(current_entry)
-                    current_entry = []
-                    in_entry = False
-                else:
-                    # Start of entry
-                    in_entry = True
+        import tempfile
 
-            if in_entry or line.startswith('---'):
-                current_entry.append(line)
+        # Back up the original log only when asked to
+        if os.environ.get('DAKOSYS_BACKUP_LOG') == '1':
+            backup_file = os.path.join(data_dir, "failed_episodes.log.bak")
+            shutil.copy2(log_file, backup_file)
 
-        # Check if we have a partial entry at the end
-        if current_entry:
-            entries.append(current_entry)
-
-        # Process entries to remove fixed episodes
-        updated_entries = []
         removed_count = 0
 
         # Normalize input types for comparison
@@ -1514,134 +2011,126 @@ def clean_error_log(anime_name, episode_type, fixed_episodes):
             elif "mixed" in normalized_type:
                 normalized_type = "mixed"
 
-        # Get the list of anime names to check - check both AFL name and Plex name
-        anime_names_to_check = [normalized_anime]
+        # Get the set of anime names to check - check both AFL name and Plex name
+        anime_names_to_check = {normalized_anime}
         
         # Check if anime_name is a Plex name and get the corresponding AFL name
-        for afl_name, plex_name in CONFIG.get('mappings', {}).items():
-            if plex_name.lower() == normalized_anime:
-                anime_names_to_check.append(afl_name.lower())
-                break
+        afl_name = _plex_to_afl_mappings().get(normalized_anime)
+        if afl_name:
+            anime_names_to_check.add(afl_name.lower())
                 
         # Check if anime_name is an AFL name and get the corresponding Plex name  
         plex_name = CONFIG.get('mappings', {}).get(normalized_anime)
         if plex_name:
-            anime_names_to_check.append(plex_name.lower())
+            anime_names_to_check.add(plex_name.lower())
             
         logger.info(f"Checking anime names for cleaning: {anime_names_to_check}")
 
-        for entry in entries:
-            # Extract anime name and episode type from entry
-            entry_anime = None
-            entry_type = None
-            entry_episodes = []
-            found_episodes_list = False
-            in_details = False
-
-            for i, line in enumerate(entry):
-                if line.startswith('Anime:'):
-                    # Extract base anime name without parentheses
-                    raw_anime = line.replace('Anime:', '').strip()
-                    entry_anime = raw_anime.split(' (')[0].strip().lower()
-                elif line.startswith('Episode Type:'):
-                    entry_type = line.replace('Episode Type:', '').strip().lower()
-                    # Normalize entry type
-                    if "canon" in entry_type:
-                        if "manga" in entry_type:
-                            entry_type = "manga"
-                        elif "anime" in entry_type:
-                            entry_type = "anime"
-                        elif "mixed" in entry_type:
-                            entry_type = "mixed"
-                elif line.startswith('Failed Episodes:'):
-                    found_episodes_list = True
-                    entry_episodes.append(line)
-                elif line.startswith('Details:'):
-                    in_details = True
-                elif in_details and not line.startswith('---'):
-                    continue  # Skip details
-                elif found_episodes_list and not in_details and line[0].isdigit() and '. ' in line:
-                    episode_name = line.split('. ', 1)[1].strip()
-                    entry_episodes.append((line, episode_name))
-
-            # Compare normalized values for more flexible matching
-            # Check if the entry anime name matches any of our anime names to check
-            if entry_anime in anime_names_to_check and entry_type == normalized_type:
-                # This entry matches, so remove fixed episodes
-                updated_episode_lines = []
-
-                for episode_entry in entry_episodes:
-                    if isinstance(episode_entry, tuple):
-                        line, episode_name = episode_entry
-                        if episode_name not in fixed_episodes:
-                            updated_episode_lines.append(line)
-                        else:
-                            removed_count += 1
-                    else:
-                        updated_episode_lines.append(episode_entry)
-
-                if len(updated_episode_lines) > 1:  # More than just the header line
-                    # Update the count in the "Failed Episodes:" line
-                    count = len(updated_episode_lines) - 1
-                    updated_episode_lines[0] = f"Failed Episodes: {count}\n"
-
-                    # Reconstruct this entry with remaining episodes
-                    new_entry = []
+        # Stream the log one entry at a time into a uniquely named temporary
+        # file next to it, so concurrent cleanups cannot clobber each other
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        tmp = tempfile.NamedTemporaryFile('w', dir=data_dir, prefix='failed_episodes.log.',
+                                          suffix='.tmp', delete=False)
+        tmp_file = tmp.name
+        try:
+            with tmp as out, open(log_file, 'r') as src:
+                os.fchmod(out.fileno(), os.stat(log_file).st_mode & 0o777)
+                out.write(f"# Mapping errors log - Updated {timestamp}\n\n")
+                for entry in _iter_log_entries(src):
+                    # Extract anime name and episode type from entry
+                    entry_anime = None
+                    entry_type = None
+                    entry_episodes = []
                     found_episodes_list = False
                     in_details = False
-                    episode_index = 1
 
                     for line in entry:
-                        if line.startswith('Details:'):
-                            in_details = True
-                            continue  # Skip the Details section entirely
-                        elif in_details and not line.startswith('---'):
-                            continue  # Skip all detail lines
-                        elif line.startswith('Failed Episodes:'):
-                            new_entry.append(updated_episode_lines[0])
+                        tag = _LOG_TAGS.get(line.partition(':')[0])
+                        if tag is None:
+                            # Episode, detail or delimiter line
+                            if in_details:
+                                continue  # Skip details
+                            episode_match = _RE_LOG_EPISODE.match(line) if found_episodes_list else None
+                            if episode_match:
+                                entry_episodes.append((line, episode_match.group(1).strip()))
+                        elif tag == 'anime':
+                            # Extract base anime name without parentheses
+                            raw_anime = line.replace('Anime:', '').strip()
+                            entry_anime = raw_anime.split(' (')[0].strip().lower()
+                        elif tag == 'type':
+                            entry_type = line.replace('Episode Type:', '').strip().lower()
+                            # Normalize entry type
+                            if "canon" in entry_type:
+                                if "manga" in entry_type:
+                                    entry_type = "manga"
+                                elif "anime" in entry_type:
+                                    entry_type = "anime"
+                                elif "mixed" in entry_type:
+                                    entry_type = "mixed"
+                        elif tag == 'episodes':
                             found_episodes_list = True
-                        elif found_episodes_list and not in_details and line[0].isdigit() and '. ' in line:
-                            if episode_index < len(updated_episode_lines):
-                                if isinstance(updated_episode_lines[episode_index], tuple):
-                                    new_entry.append(updated_episode_lines[episode_index][0])
-                                else:
-                                    new_entry.append(updated_episode_lines[episode_index])
-                                episode_index += 1
+                            entry_episodes.append(line)
                         else:
-                            new_entry.append(line)
-
-                    # Renumber the episodes
-                    final_entry = []
-                    episode_number = 1
-                    for line in new_entry:
-                        if found_episodes_list and line[0].isdigit() and '. ' in line:
-                            episode_parts = line.split('. ', 1)
-                            if len(episode_parts) > 1:
-                                episode_name = episode_parts[1]
-                                final_entry.append(f"{episode_number}. {episode_name}")
-                                episode_number += 1
-                        else:
-                            final_entry.append(line)
-
-                    updated_entries.append(final_entry)
-                else:
-                    # All episodes in this entry were fixed, so skip the entire entry
-                    removed_count += 1
-            else:
-                # This entry is for a different anime/type, keep it as-is
-                updated_entries.append(entry)
+                            in_details = True
 
-        # Write the updated log
-        with open(log_file, 'w') as f:
-            # Add a header comment
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"# Mapping errors log - Updated {timestamp}\n")
-            f.write(f"# Removed {removed_count} fixed entries for {anime_name} ({episode_type})\n\n")
+                    # Compare normalized values for more flexible matching
+                    # Check if the entry anime name matches any of our anime names to check
+                    if entry_anime in anime_names_to_check and entry_type == normalized_type:
+                        # This entry matches, so remove fixed episodes
+                        updated_episode_lines = []
+
+                        for episode_entry in entry_episodes:
+                            if isinstance(episode_entry, tuple):
+                                line, episode_name = episode_entry
+                                if episode_name not in fixed_episodes:
+                                    updated_episode_lines.append(line)
+                                else:
+                                    removed_count += 1
+                            else:
+                                updated_episode_lines.append(episode_entry)
+
+                        if len(updated_episode_lines) > 1:  # More than just the header line
+                            # Update the count in the "Failed Episodes:" line
+                            count = len(updated_episode_lines) - 1
+                            updated_episode_lines[0] = f"Failed Episodes: {count}\n"
+
+                            # Write this entry back with the remaining episodes,
+                            # renumbering them as they are written
+                            found_episodes_list = False
+                            in_details = False
+                            episode_index = 1
+
+                            for line in entry:
+                                tag = _LOG_TAGS.get(line.partition(':')[0])
+                                if tag == 'details':
+                                    in_details = True
+                                    continue  # Skip the Details section entirely
+                                elif in_details and not line.startswith('---'):
+                                    continue  # Skip all detail lines
+                                elif tag == 'episodes':
+                                    out.write(updated_episode_lines[0])
+                                    found_episodes_list = True
+                                elif found_episodes_list and not in_details and _RE_LOG_EPISODE.match(line):
+                                    if episode_index < len(updated_episode_lines):
+                                        kept_name = _RE_LOG_EPISODE.match(updated_episode_lines[episode_index]).group(1)
+                                        out.write(f"{episode_index}. {kept_name}")
+                                        episode_index += 1
+                                else:
+                                    out.write(line)
+                        else:
+                            # All episodes in this entry were fixed, so skip the entire entry
+                            removed_count += 1
+                    else:
+                        # This entry is for a different anime/type, keep it as-is
+                        out.writelines(entry)
 
-            # Write all the entries
-            for entry in updated_entries:
-                for line in entry:
-                    f.write(line)
+                # The count is only known once every entry has been streamed,
+                # so the summary goes after them (outside any entry)
+                out.write(f"\n# Removed {removed_count} fixed entries for {anime_name} ({episode_type})\n")
+            os.replace(tmp_file, log_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
         logger.info(f"Cleaned error log for {anime_name} ({episode_type}): removed {removed_count} entries")
         return True
@@ -1675,23 +2164,28 @@ def _create_list_internal(anime_name, episode_type, match_by="hybrid"):
     if not access_token:
         return False
 
-    # Connect to Plex
-    plex = connect_to_plex()
-    if not plex:
-        return False
+    # Get episodes from AnimeFillerList in the background; the scrape doesn't
+    # depend on the Plex -> TMDB -> Trakt lookups below, so their latencies
+    # overlap
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        episodes_future = executor.submit(get_anime_episodes, formatted_anime_name, episode_type_filter)
 
-    # Get TMDB ID from Plex
-    tmdb_id = get_tmdb_id_from_plex(plex, formatted_anime_name)
-    if not tmdb_id:
-        return False
+        # Connect to Plex
+        plex = connect_to_plex()
+        if not plex:
+            return False
 
-    # Get Trakt show ID
-    trakt_show_id = get_trakt_show_id(access_token, tmdb_id)
-    if not trakt_show_id:
-        return False
+        # Get TMDB ID from Plex
+        tmdb_id = get_tmdb_id_from_plex(plex, formatted_anime_name)
+        if not tmdb_id:
+            return False
 
-    # Get episodes from AnimeFillerList
-    anime_episodes = get_anime_episodes(formatted_anime_name, episode_type_filter)
+        # Get Trakt show ID
+        trakt_show_id = get_trakt_show_id(access_token, tmdb_id)
+        if not trakt_show_id:
+            return False
+
+        anime_episodes = episodes_future.result()
 
     # ADDITIONAL CODE - Apply mappings manually if needed
     title_mappings = CONFIG.get('title_mappings', {}).get(formatted_anime_name, {}).get('special_matches', {})
@@ -1709,8 +2203,11 @@ def _create_list_internal(anime_name, episode_type, match_by="hybrid"):
 
     # Display episodes that will be added
     console.print(f"\n[bold]Episodes to be added to Trakt list:[/bold]")
-    for i, episode in enumerate(anime_episodes, 1):
-        console.print(f"{i}. Episode {episode['number']}: {episode['name']} ({episode['type']})")
+    # One print for the whole list; markup is off since it is plain episode text
+    console.print("\n".join(
+        f"{i}. Episode {episode['number']}: {episode['name']} ({episode['type']})"
+        for i, episode in enumerate(anime_episodes, 1)
+    ), markup=False)
 
     # Use the correct list name format
     trakt_list_name = get_list_name_format(formatted_anime_name, episode_type)
@@ -1880,26 +2377,13 @@ def list_anime():
     try:
         console.print("[bold blue]Fetching anime list from AnimeFillerList...[/bold blue]")
 
-        base_url = 'https://www.animefillerlist.com/shows'
-        response = requests.get(base_url)
-
-        if response.status_code != 200:
-            console.print(f"[bold red]Failed to fetch data from AnimeFillerList. Status Code: {response.status_code}[/bold red]")
+        all_afl_shows = _fetch_afl_shows()
+        if all_afl_shows is None:
+            console.print("[bold red]Failed to fetch data from AnimeFillerList.[/bold red]")
             return
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        anime_list = []
-
-        # Find all anime links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if href.startswith('/shows/'):
-                anime_name = href.replace('/shows/', '')
-                if anime_name and anime_name != '':
-                    anime_list.append(anime_name)
-
         # Sort and display the list
-        anime_list = sorted(list(set(anime_list)))
+        anime_list = sorted(set(name for name in all_afl_shows if name))
 
         console.print(f"\n[bold green]Found {len(anime_list)} anime shows on AnimeFillerList:[/bold green]")
 
@@ -1922,11 +2406,7 @@ def show_episodes(anime_name):
     ANIME_NAME: Name of the anime (e.g. 'one-piece', 'attack-titan')
     """
     # Try to find in mappings first (Plex name)
-    afl_name = None
-    for name, plex_title in CONFIG.get('mappings', {}).items():
-        if plex_title.lower() == anime_name.lower():
-            afl_name = name
-            break
+    afl_name = _plex_to_afl_mappings().get(anime_name.lower())
 
     # If not found, try direct match with AFL name format
     if not afl_name:
@@ -1959,8 +2439,9 @@ def show_episodes(anime_name):
     for ep_type in episode_types:
         console.print(f"\n[bold]{ep_type} Episodes:[/bold]")
         type_episodes = [ep for ep in episodes if ep['type'] == ep_type]
-        for episode in type_episodes:
-            console.print(f"Episode {episode['number']}: {episode['name']}")
+        console.print("\n".join(
+            f"Episode {episode['number']}: {episode['name']}" for episode in type_episodes
+        ), markup=False)
 
 @cli.command()
 def test_scheduler():
@@ -1978,24 +2459,11 @@ def test_scheduler():
             console.print("[yellow]Please add a scheduler section to your config.yaml file[/yellow]")
             return
 
-        # Set dry run mode
+        # Set dry run mode for the duration of the test; this only touches the
+        # in-memory config, config.yaml is never rewritten
         original_dry_run = config['scheduler'].get('dry_run', False)
         config['scheduler']['dry_run'] = True
 
-        # Create a config copy without mappings
-        config_to_save = config.copy()
-        if 'mappings' in config_to_save:
-            del config_to_save['mappings']
-        if 'trakt_mappings' in config_to_save:
-            del config_to_save['trakt_mappings']
-        if 'title_mappings' in config_to_save:
-            del config_to_save['title_mappings']
-
-        # Save modified config temporarily
-        temp_config_path = os.path.join(DATA_DIR, 'temp_config.yaml')
-        with open(temp_config_path, 'w') as f:
-            yaml.dump(config_to_save, f)
-
         # Import and run the scheduler in test mode
         console.print("[bold blue]Testing scheduler configuration...[/bold blue]")
         console.print("[yellow]This will show when your updates would run without actually updating any lists.[/yellow]")
@@ -2026,112 +2494,64 @@ def test_scheduler():
 
         # Restore original config
         config['scheduler']['dry_run'] = original_dry_run
-        
-        # Create a config copy without mappings
-        config_to_save = config.copy()
-        if 'mappings' in config_to_save:
-            del config_to_save['mappings']
-        if 'trakt_mappings' in config_to_save:
-            del config_to_save['trakt_mappings']
-        if 'title_mappings' in config_to_save:
-            del config_to_save['title_mappings']
-        
-        with open(CONFIG_FILE, 'w') as f:
-            yaml.dump(config_to_save, f)
-
-        # Remove temp config
-        if os.path.exists(temp_config_path):
-            os.remove(temp_config_path)
 
     except Exception as e:
         console.print(f"[bold red]Error: {str(e)}[/bold red]")
 
-@cli.command()
-@click.argument('anime_name')
-@click.argument('episode_type', type=click.Choice(['FILLER', 'MANGA', 'ANIME', 'MIXED'], case_sensitive=False))
-@click.option('--match-by', type=click.Choice(['title', 'number', 'hybrid']), default='hybrid',
-              help='How to match episodes (by title, number or both)')
-@click.option('--force-map', is_flag=True, default=False,
-              help='Force mapping creation/update even if one exists')
-def create(anime_name, episode_type, match_by, force_map):
-    """Create a list for a specific episode type.
+def _resolve_anime_mapping(plex, anime_name, force_map=False):
+    """Resolve an anime name to its AnimeFillerList name and Plex show title.
 
-    ANIME_NAME: Name of the anime (e.g. 'attack-titan' or 'Attack on Titan')
-    EPISODE_TYPE: Type of episodes to include (FILLER, MANGA, ANIME, MIXED)
+    Tries the saved mappings first, then an exact Plex title match, then
+    interactive fuzzy suggestions, saving any new mapping via add_mapping.
+    Returns (afl_name, plex_show_name), or (None, None) after reporting the
+    failure.
     """
-    # Clear the error log at the start
-    clear_error_log()
-    # Map episode type input to the full name used on AnimeFillerList
-    episode_type_mapping = {
-        'FILLER': 'FILLER',
-        'MANGA': 'MANGA CANON',
-        'ANIME': 'ANIME CANON',
-        'MIXED': 'MIXED CANON/FILLER',
-    }
-
-    episode_type_filter = episode_type_mapping.get(episode_type.upper())
-
-    # Connect to Plex
-    plex = connect_to_plex()
-    if not plex:
-        return
-
-    # Get the anime library
-    try:
-        anime_library = plex.library.section(CONFIG['plex']['library'])
-    except Exception as e:
-        console.print(f"[bold red]Error accessing Plex library: {str(e)}[/bold red]")
-        return
-
     # First check: Is this an AFL name with an existing mapping?
     afl_name = format_anime_name(anime_name)
     plex_name = CONFIG.get('mappings', {}).get(afl_name)
 
     if not afl_name or not plex_name:
         # Check reverse mapping (Plex title to AFL name)
-        for afl_key, mapped_plex_title in CONFIG.get('mappings', {}).items():
-            if mapped_plex_title.lower() == anime_name.lower():
-                afl_name = afl_key
-                plex_name = mapped_plex_title
-                console.print(f"[green]Found existing mapping: {afl_name} → {plex_name}[/green]")
-                break
+        afl_key = _plex_to_afl_mappings().get(anime_name.lower())
+        if afl_key:
+            afl_name = afl_key
+            plex_name = CONFIG['mappings'][afl_key]
+            console.print(f"[green]Found existing mapping: {afl_name} → {plex_name}[/green]")
+
+    # An existing mapping already names both shows, so unless it is being
+    # remapped there is no library listing, fuzzy search or AFL fetch to do
+    if afl_name and plex_name and not force_map:
+        console.print(f"[bold green]Using mapping: {afl_name} → {plex_name}[/bold green]")
+        return afl_name, plex_name
 
     # Second check: Is this a Plex name? (direct match in Plex)
-    plex_direct_match = None
-    for show in anime_library.all():
-        if show.title.lower() == anime_name.lower():
-            plex_direct_match = show.title
-            break
+    # Get the anime library; its listing is fetched once and reused for the
+    # direct and fuzzy title matches below
+    try:
+        anime_library = plex.library.section(CONFIG['plex']['library'])
+        plex_shows = anime_library.all()
+    except Exception as e:
+        console.print(f"[bold red]Error accessing Plex library: {str(e)}[/bold red]")
+        return None, None
+
+    # Titles are read once and shared by the exact lookup and the fuzzy search;
+    # building the case-folded index in reverse keeps the first show on duplicates
+    plex_titles = [show.title for show in plex_shows]
+    title_by_lower = {title.lower(): title for title in reversed(plex_titles)}
+    plex_direct_match = title_by_lower.get(anime_name.lower())
 
     # If we have neither an AFL mapping nor a direct Plex match, try fuzzy search in Plex
-    if (not plex_name or force_map) and not plex_direct_match:
+    if not plex_direct_match:
         console.print("[yellow]No exact mapping found. Searching for matches in Plex...[/yellow]")
 
-        # Collect all Plex show titles
-        plex_titles = [show.title for show in anime_library.all()]
-
-        # Try to find matches
-        potential_matches = []
-        for title in plex_titles:
-            # Check for exact match first
-            if anime_name.lower() == title.lower():
-                potential_matches.append((title, 1.0))
-                continue
-        
-            # Check for match before colon (for titles like "Show Name: Subtitle")
-            if ':' in title:
-                before_colon = title.split(':', 1)[0].strip().lower()
-                if anime_name.lower() == before_colon:
-                    potential_matches.append((title, 0.95))  # Almost perfect match
-                    continue
-            
-            # Use simple similarity ratio as a fallback
-            similarity = difflib.SequenceMatcher(None, anime_name.lower(), title.lower()).ratio()
-            if similarity > 0.6:  # Threshold for potential matches
-                potential_matches.append((title, similarity))
-
-        # Sort by similarity
-        potential_matches.sort(key=lambda x: x[1], reverse=True)
+        # Score every title in one RapidFuzz call. WRatio also rewards titles
+        # that contain the name (e.g. "Show Name: Subtitle"), and the top
+        # matches come back best first.
+        potential_matches = [
+            (title, score / 100) for title, score, _ in
+            process.extract(anime_name, plex_titles, scorer=fuzz.WRatio,
+                            processor=utils.default_process, score_cutoff=60, limit=5)
+        ]
 
         if potential_matches:
             console.print("[green]Found potential matches in your Plex library:[/green]")
@@ -2149,30 +2569,20 @@ def create(anime_name, episode_type, match_by, force_map):
                 plex_direct_match = potential_matches[choice-1][0]
             else:
                 console.print("[yellow]No show selected. Exiting.[/yellow]")
-                return
+                return None, None
         else:
             console.print("[bold red]No matches found in your Plex library.[/bold red]")
-            return
+            return None, None
 
     # If we found a direct match in Plex but no mapping, create one
-    if plex_direct_match and (not plex_name or force_map):
+    if plex_direct_match:
         console.print(f"[green]Found direct match in Plex: {plex_direct_match}[/green]")
 
         # We need to find the corresponding AnimeFillerList name
         console.print("[bold blue]Fetching anime list from AnimeFillerList...[/bold blue]")
-        base_url = 'https://www.animefillerlist.com/shows'
-        response = requests.get(base_url)
-
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            all_afl_shows = []
-
-            # Find all anime links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('/shows/'):
-                    all_afl_shows.append(href.replace('/shows/', ''))
+        all_afl_shows = _fetch_afl_shows()
 
+        if all_afl_shows is not None:
             # First try automatic matching
             afl_name = find_best_anime_match(plex_direct_match, all_afl_shows)
 
@@ -2229,20 +2639,56 @@ def create(anime_name, episode_type, match_by, force_map):
                     add_mapping(afl_name, plex_direct_match)
         else:
             console.print("[bold red]Failed to fetch data from AnimeFillerList.[/bold red]")
-            return
+            return None, None
 
     # By this point, we should have both afl_name and either plex_name or plex_direct_match
     if not afl_name:
         console.print("[bold red]Failed to determine AnimeFillerList name.[/bold red]")
-        return
+        return None, None
 
     plex_show_name = plex_name or plex_direct_match
     if not plex_show_name:
         console.print("[bold red]Failed to determine Plex show name.[/bold red]")
-        return
+        return None, None
 
     console.print(f"[bold green]Using mapping: {afl_name} → {plex_show_name}[/bold green]")
 
+    return afl_name, plex_show_name
+
+@cli.command()
+@click.argument('anime_name')
+@click.argument('episode_type', type=click.Choice(['FILLER', 'MANGA', 'ANIME', 'MIXED'], case_sensitive=False))
+@click.option('--match-by', type=click.Choice(['title', 'number', 'hybrid']), default='hybrid',
+              help='How to match episodes (by title, number or both)')
+@click.option('--force-map', is_flag=True, default=False,
+              help='Force mapping creation/update even if one exists')
+def create(anime_name, episode_type, match_by, force_map):
+    """Create a list for a specific episode type.
+
+    ANIME_NAME: Name of the anime (e.g. 'attack-titan' or 'Attack on Titan')
+    EPISODE_TYPE: Type of episodes to include (FILLER, MANGA, ANIME, MIXED)
+    """
+    # Clear the error log at the start
+    clear_error_log()
+    # Map episode type input to the full name used on AnimeFillerList
+    episode_type_mapping = {
+        'FILLER': 'FILLER',
+        'MANGA': 'MANGA CANON',
+        'ANIME': 'ANIME CANON',
+        'MIXED': 'MIXED CANON/FILLER',
+    }
+
+    episode_type_filter = episode_type_mapping.get(episode_type.upper())
+
+    # Connect to Plex
+    plex = connect_to_plex()
+    if not plex:
+        return
+
+    afl_name, plex_show_name = _resolve_anime_mapping(plex, anime_name, force_map)
+    if not afl_name:
+        return
+
     # Now call the original create_list function but with the AFL name
     # Get auth token
     access_token = trakt_auth.ensure_trakt_auth()
@@ -2267,8 +2713,11 @@ def create(anime_name, episode_type, match_by, force_map):
 
     # Display episodes that will be added
     console.print(f"\n[bold]Episodes to be added to Trakt list:[/bold]")
-    for i, episode in enumerate(anime_episodes, 1):
-        console.print(f"{i}. Episode {episode['number']}: {episode['name']} ({episode['type']})")
+    # One print for the whole list; markup is off since it is plain episode text
+    console.print("\n".join(
+        f"{i}. Episode {episode['number']}: {episode['name']} ({episode['type']})"
+        for i, episode in enumerate(anime_episodes, 1)
+    ), markup=False)
 
     # Create or get Trakt list
     trakt_list_name = get_list_name_format(afl_name, episode_type)
@@ -2323,172 +2772,10 @@ def smart_create_all(anime_name):
     if not plex:
         return
 
-    # First check: Is this an AFL name with an existing mapping?
-    afl_name = format_anime_name(anime_name)
-    plex_name = CONFIG.get('mappings', {}).get(afl_name)
-
-    if not afl_name or not plex_name:
-        # Check reverse mapping (Plex title to AFL name)
-        for afl_key, mapped_plex_title in CONFIG.get('mappings', {}).items():
-            if mapped_plex_title.lower() == anime_name.lower():
-                afl_name = afl_key
-                plex_name = mapped_plex_title
-                console.print(f"[green]Found existing mapping: {afl_name} → {plex_name}[/green]")
-                break
-
-    # Second check: Is this a Plex name? (direct match in Plex)
-    plex_direct_match = None
-    try:
-        anime_library = plex.library.section(CONFIG['plex']['library'])
-        for show in anime_library.all():
-            if show.title.lower() == anime_name.lower():
-                plex_direct_match = show.title
-                break
-    except Exception as e:
-        console.print(f"[bold red]Error accessing Plex library: {str(e)}[/bold red]")
-        return
-
-    # If we have neither an AFL mapping nor a direct Plex match, try fuzzy search in Plex
-    if not plex_name and not plex_direct_match:
-        console.print("[yellow]No exact mapping found. Searching for matches in Plex...[/yellow]")
-
-        # Collect all Plex show titles
-        plex_titles = [show.title for show in anime_library.all()]
-
-        # Try to find matches
-        potential_matches = []
-        for title in plex_titles:
-            # Check for exact match first
-            if anime_name.lower() == title.lower():
-                potential_matches.append((title, 1.0))
-                continue
-
-            # Check for match before colon (for titles like "Show Name: Subtitle")
-            if ':' in title:
-                before_colon = title.split(':', 1)[0].strip().lower()
-                if anime_name.lower() == before_colon:
-                    potential_matches.append((title, 0.95))  # Almost perfect match
-                    continue
-
-            # Use simple similarity ratio as a fallback
-            similarity = difflib.SequenceMatcher(None, anime_name.lower(), title.lower()).ratio()
-            if similarity > 0.6:  # Threshold for potential matches
-                potential_matches.append((title, similarity))
-
-        # Sort by similarity
-        potential_matches.sort(key=lambda x: x[1], reverse=True)
-
-        if potential_matches:
-            console.print("[green]Found potential matches in your Plex library:[/green]")
-
-            # Show options
-            for i, (title, score) in enumerate(potential_matches[:5], 1):
-                console.print(f"{i}. {title} [dim](similarity: {score*100:.0f}%)[/dim]")
-
-            console.print("0. None of these - enter a different name")
-
-            # Ask user to select
-            choice = click.prompt("Select the correct show", type=int, default=1)
-
-            if choice > 0 and choice <= len(potential_matches):
-                plex_direct_match = potential_matches[choice-1][0]
-            else:
-                console.print("[yellow]No show selected. Exiting.[/yellow]")
-                return
-        else:
-            console.print("[bold red]No matches found in your Plex library.[/bold red]")
-            return
-
-    # If we found a direct match in Plex but no mapping, create one
-    if plex_direct_match and not plex_name:
-        console.print(f"[green]Found direct match in Plex: {plex_direct_match}[/green]")
-
-        # We need to find the corresponding AnimeFillerList name
-        console.print("[bold blue]Fetching anime list from AnimeFillerList...[/bold blue]")
-        base_url = 'https://www.animefillerlist.com/shows'
-        response = requests.get(base_url)
-
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            all_afl_shows = []
-
-            # Find all anime links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('/shows/'):
-                    all_afl_shows.append(href.replace('/shows/', ''))
-
-            # First try automatic matching
-            afl_name = find_best_anime_match(plex_direct_match, all_afl_shows)
-
-            if afl_name:
-                # Automatic match found - confirm with user
-                console.print(f"[bold green]Found match: {afl_name.replace('-', ' ')}[/bold green]")
-
-                if click.confirm("Use this match?", default=True):
-                    # User confirms, save the mapping
-                    add_mapping(afl_name, plex_direct_match)
-                else:
-                    # User rejects automatic match - go to manual selection
-                    afl_name = None
-
-            if not afl_name:
-                # No automatic match or user rejected it - show suggestions
-                console.print("[yellow]Please select the correct AnimeFillerList show:[/yellow]")
-
-                # Get suggestions
-                suggestions = suggest_matches(plex_direct_match, all_afl_shows)
-
-                if suggestions:
-                    console.print("[green]Potential matches:[/green]")
-
-                    # Show options
-                    for i, (name, score) in enumerate(suggestions, 1):
-                        console.print(f"{i}. {name.replace('-', ' ')} [dim](similarity: {score*100:.0f}%)[/dim]")
-
-                    console.print("0. None of these - enter manually")
-
-                    # Ask user to select
-                    choice = click.prompt("Select the correct AnimeFillerList show", type=int, default=1)
-
-                    if choice > 0 and choice <= len(suggestions):
-                        afl_name = suggestions[choice-1][0]
-
-                        add_mapping(afl_name, plex_direct_match)
-                    else:
-                        # Manual entry
-                        console.print("\n[yellow]Please enter the correct AnimeFillerList show name.[/yellow]")
-                        console.print("[yellow]You can find this by searching on https://www.animefillerlist.com/shows[/yellow]")
-                        console.print("[yellow]Format example: 'code-geass' (use hyphens, all lowercase)[/yellow]")
-
-                        afl_name = click.prompt("Enter AnimeFillerList show name")
-
-                        add_mapping(afl_name, plex_direct_match)
-                else:
-                    # No suggestions
-                    console.print("[yellow]No matches found. Please enter the correct AnimeFillerList show name.[/yellow]")
-                    console.print("[yellow]You can find this by searching on https://www.animefillerlist.com/shows[/yellow]")
-                    console.print("[yellow]Format example: 'code-geass' (use hyphens, all lowercase)[/yellow]")
-
-                    afl_name = click.prompt("Enter AnimeFillerList show name")
-
-                    add_mapping(afl_name, plex_direct_match)
-        else:
-            console.print("[bold red]Failed to fetch data from AnimeFillerList.[/bold red]")
-            return
-
-    # By this point, we should have both afl_name and either plex_name or plex_direct_match
+    afl_name, plex_show_name = _resolve_anime_mapping(plex, anime_name)
     if not afl_name:
-        console.print("[bold red]Failed to determine AnimeFillerList name.[/bold red]")
-        return
-
-    plex_show_name = plex_name or plex_direct_match
-    if not plex_show_name:
-        console.print("[bold red]Failed to determine Plex show name.[/bold red]")
         return
 
-    console.print(f"[bold green]Using mapping: {afl_name} → {plex_show_name}[/bold green]")
-
     # Get auth token
     access_token = trakt_auth.ensure_trakt_auth()
     if not access_token:
@@ -2509,6 +2796,9 @@ def smart_create_all(anime_name):
     empty_types = []
     all_failures = []
 
+    # One fetch of the show page serves every episode type below
+    episodes_by_type = get_all_anime_episodes(afl_name)
+
     for episode_type in episode_types:
         episode_type_filter = {
             'FILLER': 'FILLER',
@@ -2519,7 +2809,7 @@ def smart_create_all(anime_name):
 
         # Get episodes from AnimeFillerList
         console.print(f"\n[bold blue]Checking for {episode_type} episodes...[/bold blue]")
-        anime_episodes = get_anime_episodes(afl_name, episode_type_filter)
+        anime_episodes = episodes_by_type.get(episode_type_filter.lower(), [])
 
         if not anime_episodes or len(anime_episodes) == 0:
             console.print(f"[yellow]No {episode_type} episodes found for {afl_name}[/yellow]")
@@ -2601,19 +2891,7 @@ def smart_create_all(anime_name):
                 # Add to scheduled anime list
                 config['scheduler']['scheduled_anime'].append(afl_name)
 
-                # Create a config copy without mappings
-                config_to_save = config.copy()
-                if 'mappings' in config_to_save:
-                    del config_to_save['mappings']
-                if 'trakt_mappings' in config_to_save:
-                    del config_to_save['trakt_mappings']
-                if 'title_mappings' in config_to_save:
-                    del config_to_save['title_mappings']
-
-                # Save the cleaned config
-                config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else "config/config.yaml"
-                with open(config_path, 'w') as file:
-                    yaml.dump(config_to_save, file)
+                _save_config(config)
 
                 console.print(f"[bold green]Added '{plex_show_name}' to automatic update schedule![/bold green]")
             else:
@@ -2665,6 +2943,8 @@ def schedule(action, anime_name=None):
     ACTION: list, add, or remove
     ANIME_NAME: Name of anime (required for add/remove)
     """
+    from rich.table import Table
+
     config = CONFIG
 
     # Ensure scheduler and scheduled_anime exist
@@ -2698,11 +2978,7 @@ def schedule(action, anime_name=None):
             return
 
         # Try to find in mappings first (Plex name)
-        afl_name = None
-        for name, plex_title in config.get('mappings', {}).items():
-            if plex_title.lower() == anime_name.lower():
-                afl_name = name
-                break
+        afl_name = _plex_to_afl_mappings().get(anime_name.lower())
 
         # If not found, try direct match with AFL name format
         if not afl_name:
@@ -2717,19 +2993,7 @@ def schedule(action, anime_name=None):
         if afl_name not in config['scheduler']['scheduled_anime']:
             config['scheduler']['scheduled_anime'].append(afl_name)
 
-            # Create a config copy without mappings
-            config_to_save = config.copy()
-            if 'mappings' in config_to_save:
-                del config_to_save['mappings']
-            if 'trakt_mappings' in config_to_save:
-                del config_to_save['trakt_mappings']
-            if 'title_mappings' in config_to_save:
-                del config_to_save['title_mappings']
-
-            # Save the cleaned config
-            config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else CONFIG_FILE
-            with open(config_path, 'w') as file:
-                yaml.dump(config_to_save, file)
+            _save_config(config)
 
             console.print(f"[bold green]Added '{anime_name}' to automatic update schedule![/bold green]")
         else:
@@ -2742,11 +3006,7 @@ def schedule(action, anime_name=None):
             return
 
         # Try to find in mappings first (Plex name)
-        afl_name = None
-        for name, plex_title in config.get('mappings', {}).items():
-            if plex_title.lower() == anime_name.lower():
-                afl_name = name
-                break
+        afl_name = _plex_to_afl_mappings().get(anime_name.lower())
 
         # If not found, try direct match with AFL name format
         if not afl_name:
@@ -2756,19 +3016,7 @@ def schedule(action, anime_name=None):
         if afl_name in config['scheduler']['scheduled_anime']:
             config['scheduler']['scheduled_anime'].remove(afl_name)
 
-            # Create a config copy without mappings
-            config_to_save = config.copy()
-            if 'mappings' in config_to_save:
-                del config_to_save['mappings']
-            if 'trakt_mappings' in config_to_save:
-                del config_to_save['trakt_mappings']
-            if 'title_mappings' in config_to_save:
-                del config_to_save['title_mappings']
-
-            # Save the cleaned config
-            config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else CONFIG_FILE
-            with open(config_path, 'w') as file:
-                yaml.dump(config_to_save, file)
+            _save_config(config)
 
             console.print(f"[bold green]Removed '{anime_name}' from automatic update schedule![/bold green]")
         else:
@@ -2795,42 +3043,46 @@ def fix_mappings():
         current_entry = {}
         entries = []
 
-        with open(log_file, 'r') as f:
-            for line in f:
-                line = line.strip()
+        for line in _read_log_lines(log_file):
+            line = line.strip()
+            if not line:
+                continue
 
+            # Delimiter/detail and episode lines are recognised by their first
+            # character; the tagged header lines by the text before ':'
+            first_char = line[0]
+            if first_char == '-':
                 if line.startswith('---'):
                     if current_entry and 'anime' in current_entry and 'episodes' in current_entry:
                         entries.append(current_entry)
                     current_entry = {'episodes': [], 'details': []}
-                elif line.startswith('Anime:'):
-                    current_entry['anime'] = line.replace('Anime:', '').strip()
-                elif line.startswith('Episode Type:'):
-                    current_entry['type'] = line.replace('Episode Type:', '').strip()
-
-                    # Extract the real episode type from various formats
-                    if current_entry['type'] == 'unknown' or current_entry['type'] == 'UNKNOWN':
-                        # Try to find the type in the list of episodes - this might give clues
-                        # Don't do anything here - we'll try to determine it later
-                        pass
-                    elif 'anime' in current_entry['type'].lower():
-                        current_entry['trakt_type'] = 'ANIME'
-                    elif 'manga' in current_entry['type'].lower():
-                        current_entry['trakt_type'] = 'MANGA'
-                    elif 'filler' in current_entry['type'].lower():
-                        current_entry['trakt_type'] = 'FILLER'
-                    elif 'mixed' in current_entry['type'].lower():
-                        current_entry['trakt_type'] = 'MIXED'
-
-                elif line.startswith('Failed Episodes:'):
-                    continue  # Skip the count line
-                elif line.startswith('Details:'):
-                    in_details = True
-                elif line.startswith('-') and 'details' in current_entry:
+                elif 'details' in current_entry:
                     current_entry['details'].append(line[2:].strip())
-                elif line and line[0].isdigit() and '.' in line and 'episodes' in current_entry:
-                    episode = line.split('.', 1)[1].strip()
+                continue
+
+            if first_char.isdigit():
+                if '.' in line and 'episodes' in current_entry:
+                    episode = line.partition('.')[2].strip()
                     current_entry['episodes'].append(episode)
+                continue
+
+            key, sep, value = line.partition(':')
+            tag = _LOG_TAGS.get(key) if sep else None
+            if tag == 'anime':
+                current_entry['anime'] = value.strip()
+            elif tag == 'type':
+                current_entry['type'] = value.strip()
+
+                # Extract the real episode type from various formats
+                if current_entry['type'] == 'unknown' or current_entry['type'] == 'UNKNOWN':
+                    # Try to find the type in the list of episodes - this might give clues
+                    # Don't do anything here - we'll try to determine it later
+                    pass
+                else:
+                    trakt_type = _classify_episode_type(current_entry['type'])
+                    if trakt_type:
+                        current_entry['trakt_type'] = trakt_type
+            # 'Failed Episodes:' (the count line) and 'Details:' need no handling
 
         # Add the last entry if it exists
         if current_entry and 'anime' in current_entry and 'episodes' in current_entry:
@@ -2854,6 +3106,10 @@ def fix_mappings():
         # Track if anything was fixed
         fixed_any = False
 
+        # Plex connection and anime library, opened on first use and shared by all groups
+        plex = None
+        anime_library = None
+
         # Display and prompt for each anime
         for anime_name, group in anime_groups.items():
             console.print(f"\n[bold]Mapping errors for: {anime_name}[/bold]")
@@ -2883,24 +3139,20 @@ def fix_mappings():
                 # Get Trakt slug from Plex & Trakt
                 access_token = trakt_auth.ensure_trakt_auth(quiet=True)
                 if access_token:
-                    plex = connect_to_plex()
+                    if plex is None:
+                        plex = connect_to_plex()
                     if plex:
                         # Use the Plex name to look up the TMDB ID
                         logger.info(f"Looking for '{plex_name}' in Plex libraries...")
                         tmdb_id = None
 
-                        # Search for the show in Plex
+                        # Search for the show in Plex; the title index is cached per library
                         try:
-                            anime_library = plex.library.section(CONFIG['plex']['library'])
-                            for show in anime_library.all():
-                                if show.title.lower() == plex_name.lower():
-                                    for guid in show.guids:
-                                        if 'tmdb://' in guid.id:
-                                            tmdb_id = guid.id.split('//')[1]
-                                            logger.info(f"Found TMDB ID: {tmdb_id}")
-                                            break
-                                    if tmdb_id:
-                                        break
+                            if anime_library is None:
+                                anime_library = plex.library.section(CONFIG['plex']['library'])
+                            tmdb_id = _get_plex_title_index(anime_library).get(plex_name.lower())
+                            if tmdb_id:
+                                logger.info(f"Found TMDB ID: {tmdb_id}")
                         except Exception as e:
                             logger.error(f"Error searching Plex: {str(e)}")
 
@@ -2911,7 +3163,7 @@ def fix_mappings():
                                 headers = trakt_auth.get_trakt_headers(access_token)
                                 trakt_api_url = 'https://api.trakt.tv'
                                 show_url = f"{trakt_api_url}/shows/{trakt_show_id}?extended=full"
-                                response = requests.get(show_url, headers=headers)
+                                response = _SESSION.get(show_url, headers=headers, timeout=HTTP_TIMEOUT)
 
                                 if response.status_code == 200:
                                     show_data = response.json()
@@ -2956,12 +3208,10 @@ def fix_mappings():
                             access_token = trakt_auth.ensure_trakt_auth(quiet=True)
                             if access_token:
                                 headers = trakt_auth.get_trakt_headers(access_token)
-                                trakt_api_url = 'https://api.trakt.tv'
-                                lists_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists"
-                                response = requests.get(lists_url, headers=headers)
+                                # Cached, so several unknown-type entries share one fetch
+                                lists, _ = get_trakt_user_lists(headers)
 
-                                if response.status_code == 200:
-                                    lists = response.json()
+                                if lists is not None:
                                     # Look for lists with this anime name
                                     for lst in lists:
                                         list_name = lst.get('name', '')
@@ -2969,17 +3219,8 @@ def fix_mappings():
                                             # Extract the type from the list name
                                             if '_' in list_name:
                                                 list_type = list_name.split('_', 1)[1]
-                                                if 'anime' in list_type.lower():
-                                                    inferred_type = 'ANIME'
-                                                    break
-                                                elif 'manga' in list_type.lower():
-                                                    inferred_type = 'MANGA'
-                                                    break
-                                                elif 'filler' in list_type.lower():
-                                                    inferred_type = 'FILLER'
-                                                    break
-                                                elif 'mixed' in list_type.lower():
-                                                    inferred_type = 'MIXED'
+                                                inferred_type = _classify_episode_type(list_type)
+                                                if inferred_type:
                                                     break
                         except Exception as e:
                             # Ignore errors in getting lists
@@ -2988,15 +3229,7 @@ def fix_mappings():
                         # If we couldn't infer, check the episodes for patterns
                         if not inferred_type:
                             # For Code Geass - episodes with "Stage" or "Turn" are likely anime canon
-                            stage_count = 0
-                            turn_count = 0
-                            for ep in entry['episodes']:
-                                if 'stage' in ep.lower():
-                                    stage_count += 1
-                                if 'turn' in ep.lower():
-                                    turn_count += 1
-
-                            if stage_count > 0 or turn_count > 0:
+                            if any(_RE_STAGE_TURN.search(ep) for ep in entry['episodes']):
                                 inferred_type = 'ANIME'
 
                         # If still no type, prompt the user
@@ -3055,23 +3288,13 @@ def fix_mappings():
 
                         reload_config()
 
-                        # Check if we're running in Docker
-                        if os.environ.get('RUNNING_IN_DOCKER') == 'true':
-                            # In Docker, call the internal function directly
-                            console.print("[yellow]Running inside Docker container, calling internal create_list function...[/yellow]")
-                            success = _create_list_internal(anime_name, actual_type, "hybrid")
-                            if success:
-                                console.print("[bold green]List regenerated successfully with no mapping errors![/bold green]")
-                            else:
-                                console.print("[yellow]List regenerated but there may still be some mapping issues.[/yellow]")
+                        # This process already has the config and mappings loaded, so
+                        # regenerate in place rather than starting a new container
+                        success = _create_list_internal(anime_name, actual_type, "hybrid")
+                        if success:
+                            console.print("[bold green]List regenerated successfully with no mapping errors![/bold green]")
                         else:
-                            # Not in Docker, run Docker command
-                            import subprocess
-                            cmd = f"docker compose run --rm dakosys create-list {anime_name} {actual_type}"
-                            console.print(f"[dim]Running: {cmd}[/dim]")
-                            subprocess.run(cmd, shell=True)
-                            success = True
-                            console.print("[bold green]List regenerated![/bold green]")
+                            console.print("[yellow]List regenerated but there may still be some mapping issues.[/yellow]")
 
                         # Clean error log regardless
                         clean_error_log(anime_name, entry['type'], list(manual_mappings.keys()))
@@ -3106,6 +3329,7 @@ def add_mapping(afl_name, plex_direct_match):
             CONFIG['mappings'] = {}
 
         CONFIG['mappings'][afl_name] = plex_direct_match
+        _clear_mapping_caches()
         console.print(f"[bold green]Added mapping: {afl_name} → {plex_direct_match}[/bold green]")
         return True
     else:
@@ -3117,6 +3341,7 @@ def add_mapping(afl_name, plex_direct_match):
             CONFIG['mappings'] = {}
 
         CONFIG['mappings'][afl_name] = plex_direct_match
+        _clear_mapping_caches()
         return False
 
 def create_title_mapping(anime_name, manual_mappings=None):
@@ -3149,8 +3374,7 @@ def create_title_mapping(anime_name, manual_mappings=None):
             # Load existing mappings or create new
             mappings = {}
             if os.path.exists(mappings_file):
-                with open(mappings_file, 'r') as file:
-                    mappings = yaml.safe_load(file) or {}
+                mappings = _load_yaml_cached(mappings_file) or {}
 
             # Initialize if needed
             if 'title_mappings' not in mappings:
@@ -3165,8 +3389,7 @@ def create_title_mapping(anime_name, manual_mappings=None):
                 mappings['title_mappings'][anime_name]['special_matches'][original] = mapped
 
             # Save to mappings.yaml
-            with open(mappings_file, 'w') as file:
-                yaml.dump(mappings, file)
+            dump_yaml_atomic(mappings, mappings_file)
 
             console.print(f"[green]Saved {len(manual_mappings)} title mappings to mappings.yaml[/green]")
             return True
@@ -3296,11 +3519,7 @@ def run_update(service=None):
 def delete_list_implementation(anime_name, episode_type, all_types, force):
     """Implementation of list deletion logic that can be called by multiple commands."""
     # Try to find in mappings first (Plex name)
-    afl_name = None
-    for name, plex_title in CONFIG.get('mappings', {}).items():
-        if plex_title.lower() == anime_name.lower():
-            afl_name = name
-            break
+    afl_name = _plex_to_afl_mappings().get(anime_name.lower())
 
     # If not found, try direct match with AFL name format
     if not afl_name:
@@ -3323,15 +3542,11 @@ def delete_list_implementation(anime_name, episode_type, all_types, force):
         return
 
     trakt_api_url = 'https://api.trakt.tv'
-    lists_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists"
-
-    response = requests.get(lists_url, headers=headers)
-    if response.status_code != 200:
-        console.print(f"[bold red]Failed to get Trakt lists. Status: {response.status_code}[/bold red]")
+    trakt_lists, status_code = get_trakt_user_lists(headers)
+    if trakt_lists is None:
+        console.print(f"[bold red]Failed to get Trakt lists. Status: {status_code}[/bold red]")
         return
 
-    trakt_lists = response.json()
-
     # Find the lists to delete
     lists_to_delete = []
 
@@ -3361,14 +3576,20 @@ def delete_list_implementation(anime_name, episode_type, all_types, force):
         console.print("[yellow]Deletion canceled.[/yellow]")
         return
 
-    # Delete the lists
-    deleted_count = 0
-    deleted_lists = []
-    for list_id, list_name in lists_to_delete:
+    # Delete the lists; the requests are independent, so they run concurrently
+    # and the results are reported in the original order
+    def delete_trakt_list(list_id):
         delete_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists/{list_id}"
-        response = requests.delete(delete_url, headers=headers)
+        return _SESSION.delete(delete_url, headers=headers, timeout=HTTP_TIMEOUT)
 
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(delete_trakt_list, [list_id for list_id, _ in lists_to_delete]))
+
+    deleted_count = 0
+    deleted_lists = []
+    for (list_id, list_name), response in zip(lists_to_delete, responses):
         if response.status_code == 204:  # 204 No Content is success for DELETE
+            _TRAKT_LISTS_CACHE.pop(CONFIG['trakt']['username'], None)
             deleted_count += 1
             list_type = list_name.split('_', 1)[1] if '_' in list_name else 'unknown'
             deleted_lists.append(list_type)
@@ -3419,19 +3640,7 @@ def delete_list_implementation(anime_name, episode_type, all_types, force):
             # Remove from scheduled list
             scheduled_anime.remove(afl_name)
 
-            # Create a config copy without mappings
-            config_to_save = CONFIG.copy()
-            if 'mappings' in config_to_save:
-                del config_to_save['mappings']
-            if 'trakt_mappings' in config_to_save:
-                del config_to_save['trakt_mappings']
-            if 'title_mappings' in config_to_save:
-                del config_to_save['title_mappings']
-            
-            # Save the cleaned config
-            config_path = "/app/config/config.yaml" if os.environ.get('RUNNING_IN_DOCKER') == 'true' else CONFIG_FILE
-            with open(config_path, 'w') as file:
-                yaml.dump(config_to_save, file)
+            _save_config(CONFIG)
 
             console.print(f"[green]Removed {plex_name} from scheduler.[/green]")
 
@@ -3508,6 +3717,8 @@ def list_lists(format, filter, anime, all):
     Can be piped to other commands using --format plain
     Example: docker compose run --rm dakosys list-lists --format plain --anime "Naruto" | xargs -I{} docker compose run --rm dakosys delete-list {} --force
     """
+    from rich.table import Table
+
     # Get auth token
     access_token = trakt_auth.ensure_trakt_auth(quiet=True if format != 'table' else False)
     if not access_token:
@@ -3527,17 +3738,19 @@ def list_lists(format, filter, anime, all):
         return
 
     trakt_api_url = 'https://api.trakt.tv'
-    lists_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists"
-
-    response = requests.get(lists_url, headers=headers)
-    if response.status_code != 200:
+    trakt_lists, status_code = get_trakt_user_lists(headers)
+    if trakt_lists is None:
         if format == 'json':
-            print(json.dumps({"error": f"Failed to get lists: {response.status_code}"}))
+            print(json.dumps({"error": f"Failed to get lists: {status_code}"}))
         else:
-            console.print(f"[bold red]Failed to get Trakt lists. Status: {response.status_code}[/bold red]")
+            console.print(f"[bold red]Failed to get Trakt lists. Status: {status_code}[/bold red]")
         return
 
-    trakt_lists = response.json()
+    # If looking for a specific anime, resolve its AFL name once
+    if anime:
+        # Try to match Plex name to AFL name, then fall back to AFL format
+        afl_name = _plex_to_afl_mappings().get(anime.lower()) or format_anime_name(anime)
+        anime_prefix = f"{afl_name}_"
 
     # Count filtered lists before project filtering for accurate hidden count
     filtered_lists = []
@@ -3548,22 +3761,9 @@ def list_lists(format, filter, anime, all):
         if filter and filter.lower() not in name.lower():
             continue
 
-        # If looking for a specific anime
-        if anime:
-            # Try to match Plex name to AFL name
-            afl_name = None
-            for name_key, plex_title in CONFIG.get('mappings', {}).items():
-                if plex_title.lower() == anime.lower():
-                    afl_name = name_key
-                    break
-
-            # If not found by Plex name, try AFL format
-            if not afl_name:
-                afl_name = format_anime_name(anime)
-
-            # Only include lists for this anime
-            if not name.startswith(f"{afl_name}_"):
-                continue
+        # Only include lists for the requested anime
+        if anime and not name.startswith(anime_prefix):
+            continue
 
         # This list passes all filters
         filtered_lists.append(trakt_list)
@@ -3605,7 +3805,7 @@ def list_lists(format, filter, anime, all):
 
         # Get list item count
         list_items_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists/{trakt_list['ids']['trakt']}/items/episode"
-        count_response = requests.get(list_items_url, headers=headers)
+        count_response = _SESSION.get(list_items_url, headers=headers, timeout=HTTP_TIMEOUT)
 
         episode_count = 0
         if count_response.status_code == 200:
@@ -9,14 +9,12 @@ import sys
 import time
 import yaml
 import json
-import requests
 import re
-import difflib
 from datetime import datetime
 import logging
 from plexapi.server import PlexServer
 import mappings_manager
-from shared_utils import setup_rotating_logger
+from shared_utils import setup_rotating_logger, make_session
 from size_overlay import run_size_overlay_service
 
 # Import our authentication module
@@ -38,6 +36,11 @@ else:
 log_file = os.path.join(data_dir, "anime_trakt_manager.log")
 logger = setup_rotating_logger("anime_trakt_manager", log_file)
 
+# Pooled HTTP session so AnimeFillerList/Trakt lookups reuse keep-alive
+# connections; GETs are retried on rate limits and server errors
+HTTP_TIMEOUT = 30
+_SESSION = make_session(pool_size=10)
+
 # Global configuration
 CONFIG = None
 def load_config():
@@ -114,6 +117,8 @@ def get_anime_lists(trakt_lists):
     # Get scheduled anime list from config
     scheduled_anime = config.get('scheduler', {}).get('scheduled_anime', [])
     logger.info(f"Scheduled anime: {scheduled_anime}")
+    # Membership is tested once per Trakt list, so use a set alongside the stored list
+    scheduled_anime_set = set(scheduled_anime or [])
 
     for trakt_list in trakt_lists:
         name = trakt_list['name']
@@ -122,7 +127,7 @@ def get_anime_lists(trakt_lists):
             anime_name, episode_type = name.rsplit('_', 1)
 
             # Only include if this anime is in the scheduled list
-            if scheduled_anime and anime_name not in scheduled_anime:
+            if scheduled_anime_set and anime_name not in scheduled_anime_set:
                 # Skip without logging each one
                 continue
 
@@ -181,13 +186,14 @@ def get_anime_episodes(anime_name, episode_type_filter=None, silent=False):
         if not silent:
             logger.info(f"Fetching episode data from {anime_url}")
 
-        response = requests.get(anime_url)
+        response = _SESSION.get(anime_url, timeout=HTTP_TIMEOUT)
         if response.status_code != 200:
             logger.error(f"Failed to fetch data from AnimeFillerList. Status Code: {response.status_code}")
             return []
 
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
+        from bs4 import BeautifulSoup, SoupStrainer
+        # Only table rows are needed; lxml plus a strainer skips building the rest of the page
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('tr'))
         filtered_episodes = []
 
         # Safe configuration access - work even when CONFIG is None
@@ -280,8 +286,9 @@ def get_tmdb_id_from_plex(plex, anime_name, silent=False):
             logger.info(f"Looking for '{mapped_anime_name}' in Plex library")
 
         # Search for the show in Plex
+        mapped_anime_name_lower = mapped_anime_name.lower()
         for show in anime_library.all():
-            if show.title.lower() == mapped_anime_name.lower():
+            if show.title.lower() == mapped_anime_name_lower:
                 for guid in show.guids:
                     if 'tmdb://' in guid.id:
                         tmdb_id = guid.id.split('//')[1]
@@ -339,7 +346,7 @@ def update_anime_list(anime_list, access_token, plex, match_by="hybrid"):
     # Get Trakt show ID
     headers = trakt_auth.get_trakt_headers(access_token)
     search_api_url = f'{trakt_api_url}/search/tmdb/{tmdb_id}?type=show'
-    response = requests.get(search_api_url, headers=headers)
+    response = _SESSION.get(search_api_url, headers=headers, timeout=HTTP_TIMEOUT)
 
     if response.status_code != 200 or not response.json():
         logger.error(f"Failed to get Trakt show ID for {anime_list['anime_name']}")
@@ -355,7 +362,7 @@ def update_anime_list(anime_list, access_token, plex, match_by="hybrid"):
 
     # Get existing episodes in Trakt list
     list_items_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists/{anime_list['list_id']}/items"
-    response = requests.get(list_items_url, headers=headers)
+    response = _SESSION.get(list_items_url, headers=headers, timeout=HTTP_TIMEOUT)
     if response.status_code != 200:
         logger.error("Failed to get existing episodes")
         return False
@@ -464,7 +471,7 @@ def run_anime_episode_update(match_by="hybrid"):
         # Get Trakt show ID
         headers = trakt_auth.get_trakt_headers(access_token)
         search_api_url = f'https://api.trakt.tv/search/tmdb/{tmdb_id}?type=show'
-        response = requests.get(search_api_url, headers=headers)
+        response = _SESSION.get(search_api_url, headers=headers, timeout=HTTP_TIMEOUT)
         
         if response.status_code != 200 or not response.json():
             logger.error(f"Failed to get Trakt show ID for {anime_name} (Plex: {plex_name})")
@@ -502,7 +509,7 @@ def run_anime_episode_update(match_by="hybrid"):
                     
                     # Get existing episodes
                     list_items_url = f"https://api.trakt.tv/users/{CONFIG['trakt']['username']}/lists/{list_id}/items"
-                    response = requests.get(list_items_url, headers=headers)
+                    response = _SESSION.get(list_items_url, headers=headers, timeout=HTTP_TIMEOUT)
                     existing_episodes = []
                     existing_trakt_ids = set()
                     
@@ -595,7 +602,7 @@ def check_for_new_episodes(anime_list, access_token, plex, silent=False):
 
         # Get show ID
         search_api_url = f'{trakt_api_url}/search/tmdb/{tmdb_id}?type=show'
-        response = requests.get(search_api_url, headers=headers)
+        response = _SESSION.get(search_api_url, headers=headers, timeout=HTTP_TIMEOUT)
         if response.status_code != 200 or not response.json():
             return False
 
@@ -603,7 +610,7 @@ def check_for_new_episodes(anime_list, access_token, plex, silent=False):
 
         # Get list episodes
         list_items_url = f"{trakt_api_url}/users/{CONFIG['trakt']['username']}/lists/{anime_list['list_id']}/items"
-        response = requests.get(list_items_url, headers=headers)
+        response = _SESSION.get(list_items_url, headers=headers, timeout=HTTP_TIMEOUT)
         if response.status_code != 200:
             return False
 
@@ -9,6 +9,7 @@ import os
 import yaml
 import logging
 from rich.console import Console
+from shared_utils import load_yaml_with_json_cache, dump_yaml_atomic
 
 # Initialize console for rich output
 console = Console()
@@ -37,17 +38,16 @@ def load_mappings():
     # First try to load from dedicated mappings file
     if os.path.exists(MAPPINGS_FILE):
         try:
-            with open(MAPPINGS_FILE, 'r') as file:
-                mappings = yaml.safe_load(file)
-                # Ensure all mapping sections exist
-                if 'mappings' not in mappings:
-                    mappings['mappings'] = {}
-                if 'trakt_mappings' not in mappings:
-                    mappings['trakt_mappings'] = {}
-                if 'title_mappings' not in mappings:
-                    mappings['title_mappings'] = {}
-                    
-                return mappings
+            mappings = load_yaml_with_json_cache(MAPPINGS_FILE)
+            # Ensure all mapping sections exist
+            if 'mappings' not in mappings:
+                mappings['mappings'] = {}
+            if 'trakt_mappings' not in mappings:
+                mappings['trakt_mappings'] = {}
+            if 'title_mappings' not in mappings:
+                mappings['title_mappings'] = {}
+                
+            return mappings
         except Exception as e:
             logger.error(f"Error loading mappings from {MAPPINGS_FILE}: {str(e)}")
 
@@ -78,8 +78,7 @@ def save_mappings(mappings, migrate_from_config=False):
         os.makedirs(os.path.dirname(MAPPINGS_FILE), exist_ok=True)
         
         # Save to mappings file
-        with open(MAPPINGS_FILE, 'w') as file:
-            yaml.dump(mappings, file)
+        dump_yaml_atomic(mappings, MAPPINGS_FILE)
         
         logger.info(f"Saved mappings to {MAPPINGS_FILE}")
         
@@ -98,8 +97,7 @@ def save_mappings(mappings, migrate_from_config=False):
                     del config['title_mappings']
                 
                 # Save updated config
-                with open(CONFIG_FILE, 'w') as file:
-                    yaml.dump(config, file)
+                dump_yaml_atomic(config, CONFIG_FILE)
                 
                 logger.info(f"Updated {CONFIG_FILE} to remove migrated mappings")
             except Exception as e:
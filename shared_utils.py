@@ -1,5 +1,17 @@
+import os
+import json
 import logging
 import datetime
+import yaml
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
 def connect_to_plex():
     """Connect to Plex server."""
@@ -41,6 +53,91 @@ def get_anime_libraries(plex):
         console.print("[bold red]No valid anime libraries found. Please check your configuration.[/bold red]")
     return libraries
 
+def load_yaml_with_json_cache(path):
+    """Load a YAML file, preferring the JSON copy saved next to it by a previous load.
+
+    The JSON sidecar (<path>.json) records the (st_mtime_ns, st_size) of the YAML
+    file it was built from and is only trusted while both still match exactly,
+    so any rewrite or restore of the YAML is picked up on the next load. It is
+    created with the YAML file's permissions so secrets are not exposed.
+    """
+    json_path = path + '.json'
+    # Stat before reading: if the YAML changes in between, the recorded
+    # signature is already stale and the next load re-parses it
+    stat = os.stat(path)
+    signature = [stat.st_mtime_ns, stat.st_size]
+    try:
+        with open(json_path, 'rb') as file:
+            cached = json.load(file)
+        if isinstance(cached, dict) and cached.get('source') == signature:
+            return cached['data']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(path, 'rb') as file:
+        data = yaml.load(file, Loader=_YamlLoader)
+
+    # Only keep a sidecar when JSON round-trips the data exactly (e.g. no int keys)
+    tmp_path = f"{json_path}.{os.getpid()}.tmp"
+    try:
+        payload = json.dumps({'source': signature, 'data': data})
+        if json.loads(payload)['data'] == data:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as file:
+                os.fchmod(file.fileno(), stat.st_mode & 0o777)
+                file.write(payload)
+            os.replace(tmp_path, json_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return data
+
+def dump_yaml_atomic(data, path, sort_keys=True, **kwargs):
+    """Write data to a YAML file via a temporary file so readers never see a partial write.
+
+    The replacement keeps the existing file's permissions, since config.yaml
+    holds credentials; a new file gets the usual umask-based mode.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = None
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else 0o600)
+        with os.fdopen(fd, 'w') as file:
+            if mode is not None:
+                os.fchmod(file.fileno(), mode)
+            yaml.dump(data, file, Dumper=_YamlDumper, sort_keys=sort_keys, **kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def make_session(pool_size=10):
+    """Create a pooled HTTP session that reuses keep-alive connections.
+
+    Idempotent requests are retried on rate limits and server errors; failed
+    responses are still returned so callers can report the status code.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size * 2,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 def setup_rotating_logger(logger_name, log_file, level=logging.INFO, max_size_mb=10, backup_count=5):
     """Set up a rotating file logger with beautiful formatting."""
     import os
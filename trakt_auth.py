@@ -11,6 +11,7 @@ import yaml
 import requests
 import logging
 from rich.console import Console
+from shared_utils import make_session
 
 # Initialize console and logger
 console = Console()
@@ -20,6 +21,11 @@ logger = logging.getLogger("trakt_auth")
 DEFAULT_CONFIG_PATH = "config/config.yaml"
 DEFAULT_DATA_DIR = "data"
 
+# Pooled HTTP session so Trakt API requests reuse keep-alive connections;
+# idempotent requests are retried on rate limits and server errors
+HTTP_TIMEOUT = 30
+_SESSION = make_session(pool_size=4)
+
 def get_config_path():
     """Get the appropriate config path based on environment."""
     if os.environ.get('RUNNING_IN_DOCKER') == 'true':
@@ -412,7 +418,7 @@ def ensure_auth_during_setup(config):
         
         # Get authenticated user
         me_url = f'{trakt_api_url}/users/me'
-        response = requests.get(me_url, headers=headers)
+        response = _SESSION.get(me_url, headers=headers, timeout=HTTP_TIMEOUT)
         
         if response.status_code == 200:
             user_data = response.json()
@@ -454,13 +460,13 @@ def make_trakt_request(endpoint, method="GET", data=None, params=None):
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = _SESSION.get(url, headers=headers, params=params, timeout=HTTP_TIMEOUT)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data, params=params)
+            response = _SESSION.post(url, headers=headers, json=data, params=params, timeout=HTTP_TIMEOUT)
         elif method.upper() == "PUT":
-            response = requests.put(url, headers=headers, json=data, params=params)
+            response = _SESSION.put(url, headers=headers, json=data, params=params, timeout=HTTP_TIMEOUT)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers, params=params)
+            response = _SESSION.delete(url, headers=headers, params=params, timeout=HTTP_TIMEOUT)
         else:
             logger.error(f"Unsupported HTTP method: {method}")
             return None